@@ -1,215 +1,325 @@
-"""Flask application for fraud review detection"""
-from flask import Flask, render_template, request, redirect, url_for
+"""Quart application for fraud review detection"""
+from quart import Quart, render_template, stream_template, request, redirect, url_for
 import asyncio
+import logging
 import sys
 import os
+from typing import Dict, Optional
+
+import orjson
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from scraper.url_parser import parse_google_maps_url
-from scraper.playwright_scraper import GoogleMapsScraper
+from scraper.playwright_patches import disable_stack_capture
+
+# Must run before Playwright is used (set PW_INSPECT_STACK=1 to skip)
+disable_stack_capture()
+
+from scraper.url_parser import parse_google_maps_url_async, close_client
+from scraper.playwright_scraper import BrowserPool
 from fraud_detection.detector import FraudDetector
 from fraud_detection.scoring import FraudScorer
 from database.models import (
-    get_db_connection, save_business, save_reviewer,
+    get_db_connection, save_business, save_reviewers_bulk,
     save_reviews, save_analysis_results, get_business_by_url,
-    get_reviews_by_business, get_latest_analysis
+    get_reviews_by_business, get_latest_analysis,
+    acquire_scrape_lock, release_scrape_lock
 )
-from config import DATABASE_PATH
+from database.migrations import init_db
+from config import DATABASE_PATH, SCRAPE_LOCK_TTL_SECONDS, LOG_LEVEL
 
-app = Flask(__name__)
+logging.getLogger().setLevel(LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+app = Quart(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
 
+# Stateless analysis helpers, shared by all requests
+DETECTOR = FraudDetector()
+SCORER = FraudScorer()
+
+# Shared Chromium for all scrapes in this worker (launched in before_serving)
+BROWSER_POOL = BrowserPool(headless=True)
+
+
+@app.before_serving
+async def start_browser_pool():
+    """Apply the schema and launch the pooled browser once per worker"""
+    init_db()
+    await BROWSER_POOL.start()
+
+
+@app.after_serving
+async def close_browser_pool():
+    """Shut down the pooled browser and the shared HTTP client"""
+    await BROWSER_POOL.close()
+    await close_client()
+
 
 @app.route('/')
-def index():
+async def index():
     """Home page with URL input form"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 
 @app.route('/analyze', methods=['POST'])
-def analyze():
+async def analyze():
     """Analyze a business from Google Maps URL"""
-    url = request.form.get('url', '').strip()
+    form = await request.form
+    url = form.get('url', '').strip()
 
     # Validate URL
-    parsed = parse_google_maps_url(url)
+    parsed = await parse_google_maps_url_async(url)
     if not parsed['is_valid']:
-        return render_template('index.html', error="Invalid Google Maps URL. Please check and try again.")
+        return await render_template('index.html', error="Invalid Google Maps URL. Please check and try again.")
 
     # Use final URL after redirects
     final_url = parsed['final_url']
 
-    # Check if already analyzed (caching)
-    conn = get_db_connection(DATABASE_PATH)
-    existing_business = get_business_by_url(conn, final_url)
+    try:
+        # Check if already analyzed (caching)
+        business_id = await asyncio.to_thread(find_analyzed_business, final_url)
+        if business_id is None:
+            business_id = await analyze_single_flight(final_url)
+    except AnalysisError as e:
+        return await render_template('index.html', error=str(e))
+    except Exception as e:
+        # e.g. sqlite3.OperationalError ("database is locked") from the lock table
+        logger.exception("ERROR during analysis")
+        return await render_template('index.html', error=f"Error analyzing reviews: {str(e)}")
+
+    return redirect(url_for('report', business_id=business_id))
+
+
+class AnalysisError(Exception):
+    """Scraping or analysis failure, with a message that can be shown to the user"""
+
+
+# Scrapes currently running in this worker, keyed by final URL
+INFLIGHT: Dict[str, asyncio.Task] = {}
+
+
+async def analyze_single_flight(final_url: str) -> int:
+    """
+    Scrape and analyze a URL, sharing the work with concurrent requests for it
+
+    Requests for a URL that is already being scraped in this worker await the
+    same task instead of starting a second scrape. The check-and-insert below
+    has no await in between, so it is atomic on the event loop.
+
+    Returns:
+        business_id
+    """
+    task = INFLIGHT.get(final_url)
+    if task is None:
+        task = asyncio.create_task(scrape_and_save(final_url))
+        INFLIGHT[final_url] = task
+        task.add_done_callback(lambda _: INFLIGHT.pop(final_url, None))
+
+    # Shield so one client disconnecting doesn't cancel the scrape for the others
+    return await asyncio.shield(task)
 
-    if existing_business and existing_business.get('last_analyzed'):
-        # Use cached results
-        business_id = existing_business['id']
-        return redirect(url_for('report', business_id=business_id))
 
-    # Scrape reviews
+async def scrape_and_save(final_url: str) -> int:
+    """
+    Scrape, analyze and save a business, at most once across all workers
+
+    A row in scrape_locks acts as a cross-process mutex. If another worker
+    holds it, wait for that worker to finish and reuse its results.
+
+    Returns:
+        business_id
+    """
+    while True:
+        if await asyncio.to_thread(try_acquire_scrape_lock, final_url):
+            break
+
+        await asyncio.sleep(1)
+        business_id = await asyncio.to_thread(find_analyzed_business, final_url)
+        if business_id is not None:
+            return business_id
+
     try:
-        print(f"\n=== STARTING SCRAPE ===")
-        print(f"URL: {final_url}")
-        scraper = GoogleMapsScraper(headless=True)
-        result = asyncio.run(scrape_and_analyze(scraper, final_url))
+        # The previous holder may have saved its results between our last
+        # check and taking the lock - reuse them instead of scraping again
+        business_id = await asyncio.to_thread(find_analyzed_business, final_url)
+        if business_id is not None:
+            return business_id
+
+        result = await scrape_reviews(final_url)
 
-        # VALIDATION: Check if scraping actually worked
-        if not result:
-            return render_template('index.html', error="Scraping failed: No data returned")
+        # Saving and fraud detection block (SQLite, CPU-bound rules, waiting on
+        # rule worker processes) - run them off the event loop
+        def save():
+            with get_db_connection(DATABASE_PATH) as conn:
+                return save_and_analyze(conn, final_url, result)
 
-        if 'reviews' not in result or len(result['reviews']) == 0:
-            error_msg = f"No reviews found. Business data: {result.get('business', {}).get('name', 'Unknown')}"
-            print(f"ERROR: {error_msg}")
-            print(f"DEBUG: Result keys: {result.keys()}")
-            print(f"DEBUG: Business data: {result.get('business', {})}")
+        return await asyncio.to_thread(save)
+    finally:
+        await asyncio.to_thread(unlock_scrape, final_url)
 
-            # Save debug screenshots to help diagnose
-            print(f"DEBUG: Check debug_*.png screenshots in the fraud_review folder")
 
-            return render_template('index.html', error=error_msg + " - Check console logs and debug screenshots for details")
+def find_analyzed_business(final_url: str) -> Optional[int]:
+    """Return the ID of an already analyzed business for a URL, if any"""
+    with get_db_connection(DATABASE_PATH) as conn:
+        business = get_business_by_url(conn, final_url)
+    if business and business.get('last_analyzed'):
+        return business['id']
+    return None
 
-        print(f"✓ Scraped {len(result['reviews'])} reviews successfully")
-        print(f"✓ Business: {result['business']['name']}")
 
+def try_acquire_scrape_lock(final_url: str) -> bool:
+    """Take the cross-worker scrape lock for a URL in its own transaction"""
+    with get_db_connection(DATABASE_PATH) as conn:
+        with conn:
+            return acquire_scrape_lock(conn, final_url, SCRAPE_LOCK_TTL_SECONDS)
+
+
+def unlock_scrape(final_url: str):
+    """Release the scrape lock taken with try_acquire_scrape_lock"""
+    with get_db_connection(DATABASE_PATH) as conn:
+        with conn:
+            release_scrape_lock(conn, final_url)
+
+
+async def scrape_reviews(final_url: str) -> Dict:
+    """Scrape a business and check that reviews came back"""
+    try:
+        logger.info("=== STARTING SCRAPE ===")
+        logger.info("URL: %s", final_url)
+        result = await scrape_with_pooled_browser(BROWSER_POOL, final_url)
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"ERROR during scraping:\n{error_details}")
-        return render_template('index.html', error=f"Error scraping reviews: {str(e)}")
+        logger.exception("ERROR during scraping")
+        raise AnalysisError(f"Error scraping reviews: {str(e)}")
+
+    # VALIDATION: Check if scraping actually worked
+    if not result:
+        raise AnalysisError("Scraping failed: No data returned")
+
+    if 'reviews' not in result or len(result['reviews']) == 0:
+        error_msg = f"No reviews found. Business data: {result.get('business', {}).get('name', 'Unknown')}"
+        logger.error("ERROR: %s", error_msg)
+        # The scraper only writes debug screenshots at DEBUG log level
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Result keys: %s", result.keys())
+            logger.debug("Business data: %s", result.get('business', {}))
+            logger.info("Check debug_*.png screenshots in the fraud_review folder")
+        else:
+            logger.info("Set LOG_LEVEL=DEBUG to capture debug_*.png screenshots")
+
+        raise AnalysisError(error_msg + " - Check console logs for details")
+
+    logger.info("✓ Scraped %d reviews successfully", len(result['reviews']))
+    logger.info("✓ Business: %s", result['business']['name'])
+    return result
 
-    # Save to database
+
+def save_and_analyze(conn, final_url: str, result: Dict) -> int:
+    """Save scraped data, run fraud detection and store the analysis"""
     try:
-        print(f"\n=== SAVING TO DATABASE ===")
-        business_data = result['business']
-        business_data['url'] = final_url
-        business_id = save_business(conn, business_data)
-
-        # Save reviews
-        reviews_to_save = []
-        for review in result['reviews']:
-            # Save reviewer first
-            reviewer_data = {
-                'name': review['reviewer_name'],
-                'total_reviews_count': review.get('reviewer_total_reviews', 1)
-            }
-            reviewer_id = save_reviewer(conn, reviewer_data)
-
-            reviews_to_save.append({
-                'reviewer_id': reviewer_id,
-                'review_text': review['text'],
-                'rating': review['rating'],
-                'review_date': review['timestamp'],
-                'language': review.get('language', 'en')
-            })
-
-        save_reviews(conn, business_id, reviews_to_save)
-
-        # Run fraud detection
-        reviews_from_db = get_reviews_by_business(conn, business_id)
-        detector = FraudDetector()
-        rule_results = detector.analyze_business(reviews_from_db, business_data)
+        logger.info("=== SAVING TO DATABASE ===")
+        # One transaction for the scraped rows: a single commit instead of one per step
+        with conn:
+            business_data = result['business']
+            business_data['url'] = final_url
+            business_id = save_business(conn, business_data)
+
+            # Save all reviewers in one pass, then link reviews to their IDs
+            reviewer_ids = save_reviewers_bulk(conn, [
+                {
+                    'name': review.reviewer_name,
+                    'total_reviews_count': review.reviewer_total_reviews
+                }
+                for review in result['reviews']
+            ])
+
+            # Save reviews, keeping the same rows in memory for the detector
+            reviews_to_save = []
+            for review in result['reviews']:
+                reviewer_key = (review.reviewer_name, review.reviewer_total_reviews)
+                reviews_to_save.append({
+                    'business_id': business_id,
+                    'reviewer_id': reviewer_ids[reviewer_key],
+                    'review_text': review.text,
+                    'rating': review.rating,
+                    'review_date': review.timestamp,
+                    'language': review.language,
+                    'reviewer_name': review.reviewer_name,
+                    'reviewer_total_reviews': reviewer_key[1]
+                })
+
+            review_ids = save_reviews(conn, business_id, reviews_to_save)
+            for review, review_id in zip(reviews_to_save, review_ids):
+                review['id'] = review_id
+
+        # Run fraud detection on the in-memory rows (same shape as get_reviews_by_business),
+        # outside any transaction so the SQLite write lock isn't held while rules run
+        rule_results = DETECTOR.analyze_business(reviews_to_save, business_data)
 
         # Calculate score
-        scorer = FraudScorer()
-        final_score = scorer.calculate_score(rule_results)
-
-        # Save analysis results
-        save_analysis_results(
-            conn,
-            business_id,
-            final_score['overall_score'],
-            final_score['breakdown'],
-            rule_results
+        final_score = SCORER.calculate_score(rule_results)
+        breakdown = final_score['breakdown']
+        report_summary = SCORER.report_summary(
+            breakdown.get('TextSimilarityRule', {}).get('score', 0),
+            breakdown.get('TimingAnalysisRule', {}).get('score', 0),
+            final_score['overall_score']
         )
 
-        # Update last_analyzed timestamp
-        from database.models import update_business_analyzed_time
-        update_business_analyzed_time(conn, business_id)
+        # Short second transaction for the analysis row
+        with conn:
+            save_analysis_results(
+                conn,
+                business_id,
+                final_score['overall_score'],
+                final_score['breakdown'],
+                rule_results,
+                total_reviews_analyzed=len(reviews_to_save),
+                report_summary=report_summary
+            )
 
-        conn.close()
+            # Update last_analyzed timestamp
+            from database.models import update_business_analyzed_time
+            update_business_analyzed_time(conn, business_id)
 
-        return redirect(url_for('report', business_id=business_id))
+        return business_id
 
     except Exception as e:
-        return render_template('index.html', error=f"Error analyzing reviews: {str(e)}")
+        raise AnalysisError(f"Error analyzing reviews: {str(e)}")
 
 
 @app.route('/report/<int:business_id>')
-def report(business_id):
+async def report(business_id):
     """Display fraud detection report"""
-    conn = get_db_connection(DATABASE_PATH)
-
-    # Get business data
-    from database.models import get_business_by_id
-    business = get_business_by_id(conn, business_id)
-
-    if not business:
-        return "Business not found", 404
-
-    # Get reviews
-    reviews = get_reviews_by_business(conn, business_id)
-
-    # Get analysis results
-    analysis = get_latest_analysis(conn, business_id)
-
-    if not analysis:
-        return "Analysis not found", 404
-
-    conn.close()
-
-    # Reconstruct breakdown dict for template
-    from fraud_detection.scoring import FraudScorer
-    scorer = FraudScorer()
-
-    analysis['breakdown'] = {}
-    analysis['reasoning'] = []
-
-    # Reconstruct breakdown for each rule
-    if analysis.get('text_similarity_score', 0) > 0:
-        weight = scorer.WEIGHTS.get('TextSimilarityRule', 0)
-        score = analysis['text_similarity_score']
-        analysis['breakdown']['TextSimilarityRule'] = {
-            'score': score,
-            'weight': weight,
-            'contribution': round(score * weight, 1),
-            'reasoning': 'Text similarity analysis'
-        }
-        if score > 10:
-            analysis['reasoning'].append(f"Text Similarity: {score:.1f}% of reviews are similar")
-
-    if analysis.get('timing_burst_score', 0) > 0:
-        weight = scorer.WEIGHTS.get('TimingAnalysisRule', 0)
-        score = analysis['timing_burst_score']
-        analysis['breakdown']['TimingAnalysisRule'] = {
-            'score': score,
-            'weight': weight,
-            'contribution': round(score * weight, 1),
-            'reasoning': 'Timing cluster analysis'
-        }
-        if score > 10:
-            analysis['reasoning'].append(f"Timing Clusters: {score:.1f}% of reviews in suspicious clusters")
-
-    # Add overall_score and risk_level if not already present
-    if 'overall_score' not in analysis:
-        analysis['overall_score'] = analysis.get('fraud_score', 0)
-
-    if 'risk_level' not in analysis:
-        score = analysis['overall_score']
-        if score >= 75:
-            analysis['risk_level'] = 'HIGH'
-        elif score >= 50:
-            analysis['risk_level'] = 'MEDIUM'
-        elif score >= 25:
-            analysis['risk_level'] = 'LOW'
-        else:
-            analysis['risk_level'] = 'MINIMAL'
-
-    # Prepare data for template
-    return render_template(
+    with get_db_connection(DATABASE_PATH) as conn:
+        # Get business data
+        from database.models import get_business_by_id
+        business = get_business_by_id(conn, business_id)
+
+        if not business:
+            return "Business not found", 404
+
+        # Get reviews
+        reviews = get_reviews_by_business(conn, business_id)
+
+        # Get analysis results
+        analysis = get_latest_analysis(conn, business_id)
+
+        if not analysis:
+            return "Analysis not found", 404
+
+    if analysis.get('breakdown_json'):
+        analysis.update(orjson.loads(analysis['breakdown_json']))
+    else:
+        # Analyses saved before breakdown_json existed
+        analysis.update(SCORER.report_summary(
+            analysis.get('text_similarity_score', 0),
+            analysis.get('timing_burst_score', 0),
+            analysis.get('fraud_score', 0)
+        ))
+
+    # Prepare data for template (streamed, so the first bytes go out before the review list renders)
+    return await stream_template(
         'report.html',
         business=business,
         reviews=reviews,
@@ -218,18 +328,14 @@ def report(business_id):
     )
 
 
-async def scrape_and_analyze(scraper, url):
-    """Helper function to scrape reviews"""
-    try:
-        await scraper.initialize()
-        result = await scraper.scrape_business(url)
-        return result
-    finally:
-        await scraper.close()
+async def scrape_with_pooled_browser(pool, url):
+    """Helper function to scrape reviews in a fresh context of the pooled browser"""
+    async with pool.scraper() as scraper:
+        return await scraper.scrape_business(url)
 
 
 @app.route('/qa/test-scraper', methods=['GET', 'POST'])
-def qa_test_scraper():
+async def qa_test_scraper():
     """QA endpoint to test scraper directly"""
     if request.method == 'GET':
         return '''
@@ -245,13 +351,13 @@ def qa_test_scraper():
         </html>
         '''
 
-    url = request.form.get('url', '').strip()
+    form = await request.form
+    url = form.get('url', '').strip()
     if not url:
         return "Error: No URL provided", 400
 
     try:
-        from scraper.url_parser import parse_google_maps_url
-        parsed = parse_google_maps_url(url)
+        parsed = await parse_google_maps_url_async(url)
 
         output = []
         output.append("<html><body style='font-family: monospace; padding: 20px;'>")
@@ -269,8 +375,7 @@ def qa_test_scraper():
         output.append("<hr><h3>Starting scraper...</h3>")
         output.append("<pre>")
 
-        scraper = GoogleMapsScraper(headless=True)
-        result = asyncio.run(scrape_and_analyze(scraper, parsed['final_url']))
+        result = await scrape_with_pooled_browser(BROWSER_POOL, parsed['final_url'])
 
         output.append(f"Business Name: {result['business']['name']}\n")
         output.append(f"Total Reviews: {result['business'].get('total_reviews', 0)}\n")
@@ -281,10 +386,10 @@ def qa_test_scraper():
             output.append("First 3 reviews:\n")
             for i, review in enumerate(result['reviews'][:3], 1):
                 output.append(f"\nReview {i}:\n")
-                output.append(f"  Reviewer: {review['reviewer_name']}\n")
-                output.append(f"  Rating: {review['rating']}\n")
-                output.append(f"  Date: {review['timestamp']}\n")
-                output.append(f"  Text: {review['text'][:100]}...\n")
+                output.append(f"  Reviewer: {review.reviewer_name}\n")
+                output.append(f"  Rating: {review.rating}\n")
+                output.append(f"  Date: {review.timestamp}\n")
+                output.append(f"  Text: {review.text[:100]}...\n")
         else:
             output.append("<span style='color: red;'>WARNING: No reviews found!</span>\n")
 
@@ -10,17 +10,23 @@ DATABASE_PATH = os.path.join(BASE_DIR, 'data', 'fraud_detection.db')
 # Flask settings
 SECRET_KEY = 'dev-secret-key-change-in-production'
 DEBUG = True
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')  # e.g. WARNING in production
 
 # Scraping settings
 SCRAPING_DELAY_MIN = 2  # Minimum delay in seconds
 SCRAPING_DELAY_MAX = 5  # Maximum delay in seconds
 MAX_REVIEWS_TO_SCRAPE = 100  # Maximum number of reviews to scrape per business (for performance)
+SCRAPE_CONCURRENCY = 3  # Pages scraped in parallel by GoogleMapsScraper.scrape_businesses
+BROWSER_POOL_SIZE = 3  # Concurrent scrapes sharing the pooled browser (one context each)
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
 # Cache settings
 CACHE_DURATION_HOURS = 24  # Re-scrape if data older than 24 hours
+SCRAPE_LOCK_TTL_SECONDS = 600  # Take over another worker's scrape lock after this long
 
 # Fraud detection thresholds
 TEXT_SIMILARITY_THRESHOLD = 85  # Percent similarity to flag duplicate reviews
+TEXT_SIMILARITY_LSH_MIN_REVIEWS = 2000  # Above this, pre-filter pairs with MinHash LSH instead of a full matrix
 EMOJI_DENSITY_THRESHOLD = 3  # Emojis per 100 characters
 REVIEW_BURST_MULTIPLIER = 3  # Flag days with 3x average reviews
+PARALLEL_RULES_MIN_REVIEWS = 500  # Run rules in worker processes from this many reviews up
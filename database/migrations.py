@@ -24,11 +24,24 @@ def init_db():
         schema = f.read()
 
     cursor.executescript(schema)
+    migrate_db(conn)
     conn.commit()
     conn.close()
 
     print(f"Database initialized successfully at {DATABASE_PATH}")
 
 
+def migrate_db(conn: sqlite3.Connection):
+    """Bring databases created by older schema versions up to date"""
+    cursor = conn.cursor()
+
+    # analysis_results.breakdown_json - precomputed report breakdown
+    cursor.execute('PRAGMA table_info(analysis_results)')
+    columns = {row[1] for row in cursor.fetchall()}
+    if 'breakdown_json' not in columns:
+        cursor.execute('ALTER TABLE analysis_results ADD COLUMN breakdown_json TEXT')
+        print("Migrated analysis_results: added breakdown_json")
+
+
 if __name__ == '__main__':
     init_db()
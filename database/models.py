@@ -1,17 +1,75 @@
-"""Database models and CRUD operations"""
+"""Database models and CRUD operations
+
+Write helpers do not commit; callers own the transaction, e.g.
+`with conn: save_business(...); save_reviews(...)`.
+"""
+import queue
 import sqlite3
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
-import json
+from collections import OrderedDict, namedtuple
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+import orjson
+
+# Idle connections per database path (see get_db_connection)
+DB_POOL_SIZE = 8
+_connection_pools: Dict[str, "queue.Queue[sqlite3.Connection]"] = {}
+
+# In-process cache of business rows keyed by URL (see get_business_by_url)
+BUSINESS_CACHE_SIZE = 1024
+_business_by_url_cache: "OrderedDict[str, Dict]" = OrderedDict()
+# Saves run in worker threads (asyncio.to_thread) while the loop reads the cache
+_business_cache_lock = threading.Lock()
 
+# (name, total_reviews_count) pairs per lookup query - 2 bound parameters each
+_REVIEWER_KEYS_PER_QUERY = 400
 
-def get_db_connection(db_path: str) -> sqlite3.Connection:
-    """Create database connection with row factory"""
-    conn = sqlite3.connect(db_path)
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open and configure a new database connection"""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
     conn.row_factory = sqlite3.Row  # Access columns by name
+    # WAL lets readers run alongside a writer; NORMAL sync is safe with WAL
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-131072')  # 128 MB page cache
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')  # 256 MB
     return conn
 
 
+@contextmanager
+def get_db_connection(db_path: str) -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a pooled database connection
+
+    Usage:
+        with get_db_connection(DATABASE_PATH) as conn:
+            with conn:  # transaction
+                ...
+
+    Connections are returned to the pool on exit (an open transaction is
+    rolled back first), so their page and statement caches are reused.
+    """
+    pool = _connection_pools.setdefault(db_path, queue.Queue(maxsize=DB_POOL_SIZE))
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _connect(db_path)
+
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
 # ==================== BUSINESSES ====================
 
 def save_business(conn: sqlite3.Connection, business_data: Dict) -> int:
@@ -24,6 +82,8 @@ def save_business(conn: sqlite3.Connection, business_data: Dict) -> int:
     Returns:
         business_id
     """
+    with _business_cache_lock:
+        _business_by_url_cache.pop(business_data['url'], None)
     cursor = conn.cursor()
 
     # Check if business exists
@@ -45,7 +105,6 @@ def save_business(conn: sqlite3.Connection, business_data: Dict) -> int:
             business_data.get('average_rating'),
             business_data['url']
         ))
-        conn.commit()
         return existing['id']
     else:
         # Insert new business
@@ -60,16 +119,35 @@ def save_business(conn: sqlite3.Connection, business_data: Dict) -> int:
             business_data.get('total_reviews'),
             business_data.get('average_rating')
         ))
-        conn.commit()
         return cursor.lastrowid
 
 
 def get_business_by_url(conn: sqlite3.Connection, url: str) -> Optional[Dict]:
-    """Get business by URL"""
+    """
+    Get business by URL
+
+    Found rows are kept in a small in-process LRU so repeat submissions of the
+    same URL skip the database. save_business() and
+    update_business_analyzed_time() invalidate the cached entry.
+    """
+    with _business_cache_lock:
+        cached = _business_by_url_cache.get(url)
+        if cached is not None:
+            _business_by_url_cache.move_to_end(url)
+            return dict(cached)
+
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM businesses WHERE url = ?', (url,))
     row = cursor.fetchone()
-    return dict(row) if row else None
+    if not row:
+        return None
+
+    business = dict(row)
+    with _business_cache_lock:
+        _business_by_url_cache[url] = business
+        if len(_business_by_url_cache) > BUSINESS_CACHE_SIZE:
+            _business_by_url_cache.popitem(last=False)
+    return dict(business)
 
 
 def get_business_by_id(conn: sqlite3.Connection, business_id: int) -> Optional[Dict]:
@@ -82,12 +160,20 @@ def get_business_by_id(conn: sqlite3.Connection, business_id: int) -> Optional[D
 
 def update_business_analyzed_time(conn: sqlite3.Connection, business_id: int):
     """Update last_analyzed timestamp"""
+    _invalidate_cached_business(business_id)
     cursor = conn.cursor()
     cursor.execute(
         'UPDATE businesses SET last_analyzed = CURRENT_TIMESTAMP WHERE id = ?',
         (business_id,)
     )
-    conn.commit()
+
+
+def _invalidate_cached_business(business_id: int):
+    """Drop a business from the URL cache by its ID"""
+    with _business_cache_lock:
+        for url, business in list(_business_by_url_cache.items()):
+            if business['id'] == business_id:
+                del _business_by_url_cache[url]
 
 
 # ==================== REVIEWERS ====================
@@ -131,22 +217,83 @@ def save_reviewer(conn: sqlite3.Connection, reviewer_data: Dict) -> int:
             reviewer_data.get('total_reviews_count'),
             reviewer_data.get('account_age_days')
         ))
-        conn.commit()
         return cursor.lastrowid
 
 
+def save_reviewers_bulk(conn: sqlite3.Connection, reviewers: List[Dict]) -> Dict[Tuple[str, int], int]:
+    """
+    Insert any new reviewers in one pass and return all their IDs
+
+    Reviewers are identified by (name, total_reviews_count), matching the
+    UNIQUE constraint on the reviewers table, so existing rows are left as-is.
+
+    Args:
+        reviewers: List of {'name', 'google_id', 'total_reviews_count', 'account_age_days'}
+
+    Returns:
+        {(name, total_reviews_count): reviewer_id}
+    """
+    cursor = conn.cursor()
+
+    cursor.executemany('''
+        INSERT OR IGNORE INTO reviewers (name, google_id, total_reviews_count, account_age_days)
+        VALUES (?, ?, ?, ?)
+    ''', [
+        (
+            reviewer['name'],
+            reviewer.get('google_id'),
+            reviewer.get('total_reviews_count'),
+            reviewer.get('account_age_days')
+        )
+        for reviewer in reviewers
+    ])
+
+    # Map keys back to IDs, chunked to stay under SQLite's bound-parameter limit
+    keys = list(dict.fromkeys(
+        (reviewer['name'], reviewer.get('total_reviews_count')) for reviewer in reviewers
+    ))
+    reviewer_ids = {}
+    for start in range(0, len(keys), _REVIEWER_KEYS_PER_QUERY):
+        chunk = keys[start:start + _REVIEWER_KEYS_PER_QUERY]
+        placeholders = ', '.join(['(?, ?)'] * len(chunk))
+        cursor.execute(f'''
+            SELECT id, name, total_reviews_count FROM reviewers
+            WHERE (name, total_reviews_count) IN (VALUES {placeholders})
+        ''', [value for key in chunk for value in key])
+        for row in cursor.fetchall():
+            reviewer_ids[(row['name'], row['total_reviews_count'])] = row['id']
+
+    return reviewer_ids
+
+
 # ==================== REVIEWS ====================
 
-def save_reviews(conn: sqlite3.Connection, business_id: int, reviews: List[Dict]):
+# Row shape returned by get_reviews_by_business (same order as its SELECT)
+ReviewRow = namedtuple('ReviewRow', [
+    'id', 'business_id', 'reviewer_id', 'review_text', 'rating',
+    'review_date', 'language', 'reviewer_name', 'reviewer_total_reviews'
+])
+
+
+def save_reviews(conn: sqlite3.Connection, business_id: int, reviews: List[Dict]) -> List[int]:
     """
-    Bulk insert reviews
+    Insert reviews
 
     Args:
         reviews: List of {'reviewer_id', 'review_text', 'rating', 'review_date', 'language'}
+
+    Returns:
+        New review IDs, in the same order as `reviews`
     """
     cursor = conn.cursor()
 
-    review_tuples = [
+    if not reviews:
+        return []
+
+    cursor.executemany('''
+        INSERT INTO reviews (business_id, reviewer_id, review_text, rating, review_date, language)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', [
         (
             business_id,
             review['reviewer_id'],
@@ -156,19 +303,26 @@ def save_reviews(conn: sqlite3.Connection, business_id: int, reviews: List[Dict]
             review.get('language')
         )
         for review in reviews
-    ]
+    ])
 
-    cursor.executemany('''
-        INSERT INTO reviews (business_id, reviewer_id, review_text, rating, review_date, language)
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', review_tuples)
+    # The caller's transaction holds the write lock and ids only grow
+    # (AUTOINCREMENT), so this business's newest len(reviews) rows are ours
+    cursor.execute(
+        'SELECT id FROM reviews WHERE business_id = ? ORDER BY id DESC LIMIT ?',
+        (business_id, len(reviews))
+    )
+    return [row[0] for row in reversed(cursor.fetchall())]
 
-    conn.commit()
 
+def get_reviews_by_business(conn: sqlite3.Connection, business_id: int) -> List[ReviewRow]:
+    """
+    Get all reviews for a business
 
-def get_reviews_by_business(conn: sqlite3.Connection, business_id: int) -> List[Dict]:
-    """Get all reviews for a business"""
+    Rows are returned as ReviewRow tuples rather than dicts; use
+    row._asdict() where a dict is needed (e.g. to feed FraudRule.analyze).
+    """
     cursor = conn.cursor()
+    cursor.row_factory = None  # plain tuples - ReviewRow names the fields
     cursor.execute('''
         SELECT
             r.id,
@@ -186,18 +340,47 @@ def get_reviews_by_business(conn: sqlite3.Connection, business_id: int) -> List[
         ORDER BY r.review_date DESC
     ''', (business_id,))
 
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    return list(map(ReviewRow._make, cursor.fetchall()))
 
 
 # ==================== ANALYSIS RESULTS ====================
 
+class LazyJSONList(Sequence):
+    """Read-only list view over a JSON array column, decoded on first access"""
+
+    __slots__ = ('_raw', '_items')
+
+    def __init__(self, raw: Optional[str]):
+        self._raw = raw
+        self._items: Optional[List] = None
+
+    def _load(self) -> List:
+        if self._items is None:
+            self._items = orjson.loads(self._raw) if self._raw else []
+            self._raw = None
+        return self._items
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __repr__(self) -> str:
+        return f"LazyJSONList({self._load()!r})"
+
+
 def save_analysis_results(
     conn: sqlite3.Connection,
     business_id: int,
     fraud_score: float,
     breakdown: Dict,
-    rule_results: Dict
+    rule_results: Dict,
+    total_reviews_analyzed: Optional[int] = None,
+    report_summary: Optional[Dict] = None
 ):
     """
     Save fraud analysis results
@@ -207,6 +390,9 @@ def save_analysis_results(
         fraud_score: Overall fraud score (0-100)
         breakdown: Score breakdown from FraudScorer
         rule_results: Raw results from all fraud rules
+        total_reviews_analyzed: Number of reviews the rules ran on
+                                (counted from the reviews table if omitted)
+        report_summary: Precomputed report page data from FraudScorer.report_summary
     """
     cursor = conn.cursor()
 
@@ -218,26 +404,29 @@ def save_analysis_results(
     timing_burst_score = breakdown.get('TimingAnalysisRule', {}).get('score', 0)
     emoji_density_score = breakdown.get('EmojiDensityRule', {}).get('score', 0)
 
-    # Extract flagged items as JSON
-    similar_review_pairs = json.dumps(
+    # Extract flagged items as JSON (orjson writes datetimes as ISO 8601 strings)
+    similar_review_pairs = orjson.dumps(
         rule_results.get('TextSimilarityRule', {}).get('flagged_items', [])
-    )
-    timing_clusters = json.dumps(
+    ).decode()
+    timing_clusters = orjson.dumps(
         rule_results.get('TimingAnalysisRule', {}).get('flagged_items', [])
-    )
-    suspicious_reviewers = json.dumps(
+    ).decode()
+    suspicious_reviewers = orjson.dumps(
         rule_results.get('ReviewerProfileRule', {}).get('flagged_items', [])
-    )
-    ai_flagged_reviews = json.dumps(
+    ).decode()
+    ai_flagged_reviews = orjson.dumps(
         rule_results.get('AIGeneratedRule', {}).get('flagged_items', [])
-    )
+    ).decode()
+
+    breakdown_json = orjson.dumps(report_summary).decode() if report_summary is not None else None
 
     # Count flagged reviews (rough estimate)
     flagged_reviews_count = len(rule_results.get('TextSimilarityRule', {}).get('flagged_items', []))
 
     # Get total reviews analyzed
-    reviews = get_reviews_by_business(conn, business_id)
-    total_reviews_analyzed = len(reviews)
+    if total_reviews_analyzed is None:
+        cursor.execute('SELECT COUNT(*) FROM reviews WHERE business_id = ?', (business_id,))
+        total_reviews_analyzed = cursor.fetchone()[0]
 
     # Insert analysis results
     cursor.execute('''
@@ -245,17 +434,17 @@ def save_analysis_results(
             business_id, fraud_score, total_reviews_analyzed, flagged_reviews_count,
             text_similarity_score, ai_generated_score, rating_distribution_score,
             account_age_score, timing_burst_score, emoji_density_score,
-            similar_review_pairs, timing_clusters, suspicious_reviewers, ai_flagged_reviews
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            similar_review_pairs, timing_clusters, suspicious_reviewers, ai_flagged_reviews,
+            breakdown_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     ''', (
         business_id, fraud_score, total_reviews_analyzed, flagged_reviews_count,
         text_similarity_score, ai_generated_score, rating_distribution_score,
         account_age_score, timing_burst_score, emoji_density_score,
-        similar_review_pairs, timing_clusters, suspicious_reviewers, ai_flagged_reviews
+        similar_review_pairs, timing_clusters, suspicious_reviewers, ai_flagged_reviews,
+        breakdown_json
     ))
 
-    conn.commit()
-
 
 def get_latest_analysis(conn: sqlite3.Connection, business_id: int) -> Optional[Dict]:
     """Get the latest analysis results for a business"""
@@ -273,10 +462,36 @@ def get_latest_analysis(conn: sqlite3.Connection, business_id: int) -> Optional[
 
     result = dict(row)
 
-    # Parse JSON fields
-    result['similar_review_pairs'] = json.loads(result.get('similar_review_pairs', '[]'))
-    result['timing_clusters'] = json.loads(result.get('timing_clusters', '[]'))
-    result['suspicious_reviewers'] = json.loads(result.get('suspicious_reviewers', '[]'))
-    result['ai_flagged_reviews'] = json.loads(result.get('ai_flagged_reviews', '[]'))
+    # JSON fields are parsed lazily - only if the caller actually reads them
+    result['similar_review_pairs'] = LazyJSONList(result.get('similar_review_pairs'))
+    result['timing_clusters'] = LazyJSONList(result.get('timing_clusters'))
+    result['suspicious_reviewers'] = LazyJSONList(result.get('suspicious_reviewers'))
+    result['ai_flagged_reviews'] = LazyJSONList(result.get('ai_flagged_reviews'))
 
     return result
+
+
+# ==================== SCRAPE LOCKS ====================
+
+def acquire_scrape_lock(conn: sqlite3.Connection, url: str, ttl_seconds: int) -> bool:
+    """
+    Try to claim the right to scrape a URL (cross-process mutex)
+
+    Locks older than ttl_seconds are treated as abandoned and taken over.
+
+    Returns:
+        True if this caller now holds the lock
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "DELETE FROM scrape_locks WHERE url = ? AND acquired_at < datetime('now', ?)",
+        (url, f'-{ttl_seconds} seconds')
+    )
+    cursor.execute('INSERT OR IGNORE INTO scrape_locks (url) VALUES (?)', (url,))
+    return cursor.rowcount == 1
+
+
+def release_scrape_lock(conn: sqlite3.Connection, url: str):
+    """Release a lock taken with acquire_scrape_lock"""
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM scrape_locks WHERE url = ?', (url,))
@@ -60,13 +60,25 @@ CREATE TABLE IF NOT EXISTS analysis_results (
     suspicious_reviewers TEXT,
     ai_flagged_reviews TEXT,
 
+    -- Report page breakdown/reasoning/risk level, precomputed at save time (JSON)
+    breakdown_json TEXT,
+
     analysis_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (business_id) REFERENCES businesses(id) ON DELETE CASCADE
 );
 
+-- In-progress scrapes (single-flight lock shared by all app workers)
+CREATE TABLE IF NOT EXISTS scrape_locks (
+    url TEXT PRIMARY KEY,
+    acquired_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_businesses_url ON businesses(url);
 CREATE INDEX IF NOT EXISTS idx_reviews_business ON reviews(business_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_reviewer ON reviews(reviewer_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_date ON reviews(review_date);
 CREATE INDEX IF NOT EXISTS idx_analysis_business ON analysis_results(business_id);
+-- Covering sort orders for get_reviews_by_business / get_latest_analysis
+CREATE INDEX IF NOT EXISTS idx_reviews_business_date ON reviews(business_id, review_date DESC);
+CREATE INDEX IF NOT EXISTS idx_analysis_business_ts ON analysis_results(business_id, analysis_timestamp DESC);
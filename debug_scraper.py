@@ -1,31 +1,68 @@
 """Debug script to diagnose scraper issues"""
 import asyncio
+import sys
 from playwright.async_api import async_playwright
 
-async def debug_scrape(url):
-    """Debug scraper with visual browser and screenshots"""
-    print(f"\n=== DEBUG SCRAPER ===")
-    print(f"URL: {url}\n")
+# Same request blocking as the real scraper, so diagnosis sees the same page
+from scraper.playwright_scraper import TRACKER_RE, block_assets
 
+async def _make_browser():
+    """Start Playwright and launch one visible browser to share across URLs"""
     playwright = await async_playwright().start()
     browser = await playwright.chromium.launch(
         headless=False,  # Show browser window
         args=['--disable-blink-features=AutomationControlled']
     )
+    return playwright, browser
+
+
+async def _scrape_one(browser, url, prefix='debug', interactive=True):
+    """
+    Debug scraper with visual browser and screenshots
+
+    Runs in a fresh context of the shared browser; only the context is closed.
+
+    Args:
+        browser: Browser from _make_browser
+        url: Google Maps URL to diagnose
+        prefix: Screenshot filename prefix
+        interactive: Pause for manual inspection before closing the context
+    """
+    print(f"\n=== DEBUG SCRAPER ===")
+    print(f"URL: {url}\n")
 
     context = await browser.new_context(
         locale='en-US',
         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     )
+    # Interactive runs keep images/fonts so the page can be inspected visually
+    await context.route('**/*', block_assets if not interactive else _block_trackers)
+    try:
+        page = await context.new_page()
+        await _diagnose(page, url, prefix, interactive)
+    finally:
+        await context.close()
+
+
+async def _block_trackers(route):
+    """Abort analytics/ad requests only"""
+    if TRACKER_RE.search(route.request.url):
+        await route.abort()
+    else:
+        await route.continue_()
 
-    page = await context.new_page()
 
+async def _diagnose(page, url, prefix, interactive):
+    """Step through the scraper's selectors on page, printing what matches"""
     # Navigate
     print(f"1. Navigating to URL...")
     await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-    await asyncio.sleep(3)
-    await page.screenshot(path='debug_1_initial.png')
-    print(f"   ✓ Screenshot saved: debug_1_initial.png")
+    try:
+        await page.wait_for_selector('h1', timeout=10000)
+    except Exception:
+        print(f"   - No h1 after 10s, continuing anyway")
+    await page.screenshot(path=f'{prefix}_1_initial.png')
+    print(f"   ✓ Screenshot saved: {prefix}_1_initial.png")
 
     # Check for business name
     print(f"\n2. Looking for business name...")
@@ -66,13 +103,16 @@ async def debug_scrape(url):
     if review_button:
         print(f"\n4. Clicking Reviews button...")
         await review_button.click()
-        await asyncio.sleep(3)
-        await page.screenshot(path='debug_2_after_click.png')
-        print(f"   ✓ Screenshot saved: debug_2_after_click.png")
+        try:
+            await page.wait_for_selector('div[role="feed"], div.m6QErb', timeout=10000)
+        except Exception:
+            print(f"   - No reviews feed after 10s, continuing anyway")
+        await page.screenshot(path=f'{prefix}_2_after_click.png')
+        print(f"   ✓ Screenshot saved: {prefix}_2_after_click.png")
     else:
         print(f"   ✗ Could not find Reviews button")
-        await page.screenshot(path='debug_2_no_button.png')
-        print(f"   ✓ Screenshot saved: debug_2_no_button.png")
+        await page.screenshot(path=f'{prefix}_2_no_button.png')
+        print(f"   ✓ Screenshot saved: {prefix}_2_no_button.png")
 
     # Check for reviews container
     print(f"\n5. Looking for reviews container...")
@@ -119,8 +159,11 @@ async def debug_scrape(url):
     else:
         print(f"   ✗ Skipped (no container)")
 
-    await page.screenshot(path='debug_3_final.png')
-    print(f"\n✓ Final screenshot saved: debug_3_final.png")
+    await page.screenshot(path=f'{prefix}_3_final.png')
+    print(f"\n✓ Final screenshot saved: {prefix}_3_final.png")
+
+    if not interactive:
+        return
 
     print(f"\n=== MANUAL INSPECTION ===")
     print(f"Browser window is open. Please:")
@@ -132,14 +175,68 @@ async def debug_scrape(url):
     print(f"\nPress Enter to close browser...")
     input()
 
-    await browser.close()
-    await playwright.stop()
+
+async def scrape_many(urls):
+    """Diagnose several URLs one after another in one shared browser"""
+    playwright, browser = await _make_browser()
+    try:
+        for i, url in enumerate(urls):
+            prefix = 'debug' if len(urls) == 1 else f'debug{i + 1}'
+            await _scrape_one(browser, url, prefix=prefix, interactive=len(urls) == 1)
+    finally:
+        await browser.close()
+        await playwright.stop()
 
     print(f"\n✓ Debug complete. Check screenshots for details.")
 
 
+async def scrape_batch(urls, max_concurrency=5):
+    """
+    Diagnose several URLs in parallel, one context each in a shared browser
+
+    Args:
+        urls: Google Maps URLs to diagnose
+        max_concurrency: Maximum contexts open at the same time
+
+    Returns:
+        List with None for each URL that finished, or the exception it raised
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    playwright, browser = await _make_browser()
+
+    async def _one(i, url):
+        async with semaphore:
+            await _scrape_one(browser, url, prefix=f'debug{i + 1}', interactive=False)
+
+    try:
+        results = await asyncio.gather(
+            *[_one(i, url) for i, url in enumerate(urls)],
+            return_exceptions=True
+        )
+    finally:
+        await browser.close()
+        await playwright.stop()
+
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"✗ {url}: {result}")
+
+    print(f"\n✓ Debug complete. Check screenshots for details.")
+    return results
+
+
+async def main(urls):
+    """Entry point: diagnose all URLs with a single browser launch"""
+    if len(urls) == 1:
+        await scrape_many(urls)
+    else:
+        await scrape_batch(urls)
+
+
 if __name__ == '__main__':
-    # Replace with your URL
-    url = "https://www.google.com/maps/place/%D7%99%D7%A8%D7%99%D7%93+%D7%94%D7%97%D7%A9%D7%9E%D7%9C%E2%80%AD/@31.991078,34.876977,17z/data=!3m1!4b1!4m6!3m5!1s0x1502caba776b7693:0x70f05b0377467d37!8m2!3d31.991078!4d34.876977!16s%2Fg%2F11h7s42pz3?entry=ttu&g_ep=EgoyMDI2MDIxMS4wIKXMDSoASAFQAw%3D%3D"
+    # Replace with your URL(s)
+    urls = sys.argv[1:] or [
+        "https://www.google.com/maps/place/%D7%99%D7%A8%D7%99%D7%93+%D7%94%D7%97%D7%A9%D7%9E%D7%9C%E2%80%AD/@31.991078,34.876977,17z/data=!3m1!4b1!4m6!3m5!1s0x1502caba776b7693:0x70f05b0377467d37!8m2!3d31.991078!4d34.876977!16s%2Fg%2F11h7s42pz3?entry=ttu&g_ep=EgoyMDI2MDIxMS4wIKXMDSoASAFQAw%3D%3D"
+    ]
 
-    asyncio.run(debug_scrape(url))
+    asyncio.run(main(urls))
@@ -0,0 +1,65 @@
+"""Compiled numeric kernels shared by fraud detection rules"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional - fall back to running the kernels as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+# Characters are folded into this many histogram bins (see char_histograms)
+CHAR_BINS = 256
+
+
+def char_histograms(texts):
+    """
+    Per-text character counts, with code points folded into CHAR_BINS bins
+
+    Args:
+        texts: List of strings
+
+    Returns:
+        int32 array of shape (len(texts), CHAR_BINS)
+    """
+    histograms = np.zeros((len(texts), CHAR_BINS), dtype=np.int32)
+    for idx, text in enumerate(texts):
+        code_points = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        histograms[idx] = np.bincount(code_points % CHAR_BINS, minlength=CHAR_BINS)
+    return histograms
+
+
+@njit(parallel=True, cache=True)
+def shared_char_counts(histograms, left, right):
+    """
+    For each pair (left[k], right[k]), sum of per-bin minimum character counts
+
+    JIT-compiled on first call (only the LSH path of TextSimilarityRule uses
+    it), and the compiled code is cached on disk for later processes.
+
+    Folding characters into bins can only merge counts, so this is never less
+    than the number of characters the two texts have in common - an upper
+    bound usable to reject pairs before running the edit-distance DP.
+
+    Args:
+        histograms: int32 (n_texts, CHAR_BINS) array from char_histograms
+        left, right: int64 arrays of text indices, one entry per pair
+
+    Returns:
+        int64 array with one count per pair
+    """
+    n_pairs = left.shape[0]
+    n_bins = histograms.shape[1]
+    shared = np.empty(n_pairs, dtype=np.int64)
+    for k in prange(n_pairs):
+        a = histograms[left[k]]
+        b = histograms[right[k]]
+        total = 0
+        for m in range(n_bins):
+            total += min(a[m], b[m])
+        shared[k] = total
+    return shared
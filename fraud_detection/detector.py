@@ -1,13 +1,34 @@
 """Fraud detection orchestrator - runs all fraud detection rules"""
-import sys
-import os
-from typing import Dict, List
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from fraud_detection.base import FraudRule
 from fraud_detection.rules.text_similarity import TextSimilarityRule
 from fraud_detection.rules.timing_analysis import TimingAnalysisRule
+from config import PARALLEL_RULES_MIN_REVIEWS
+
+logger = logging.getLogger(__name__)
+
+# Worker processes for CPU-bound rules, created on first large analysis
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+# Analyses run in worker threads (asyncio.to_thread); only one may start the pool
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared rule executor, starting it if needed"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            # spawn, not fork: the web app process has Playwright/event-loop threads
+            _EXECUTOR = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _EXECUTOR
 
 
 class FraudDetector:
@@ -17,12 +38,24 @@ class FraudDetector:
     Runs all enabled fraud detection rules and collects results
     """
 
-    def __init__(self):
-        """Initialize with fraud detection rules"""
-        self.rules = [
-            TextSimilarityRule(),
-            TimingAnalysisRule()
-        ]
+    # Default rules, built on first use and shared by every detector
+    _DEFAULT_RULES: Optional[Tuple[FraudRule, ...]] = None
+
+    def __init__(self, rules: Optional[Sequence[FraudRule]] = None):
+        """
+        Initialize with fraud detection rules
+
+        Args:
+            rules: Rules to run (defaults to the shared text similarity + timing rules)
+        """
+        if rules is None:
+            if FraudDetector._DEFAULT_RULES is None:
+                FraudDetector._DEFAULT_RULES = (
+                    TextSimilarityRule(),
+                    TimingAnalysisRule()
+                )
+            rules = FraudDetector._DEFAULT_RULES
+        self.rules = rules
 
     def analyze_business(self, reviews: List[Dict], business_data: Dict) -> Dict:
         """
@@ -41,14 +74,24 @@ class FraudDetector:
         """
         results = {}
 
-        for rule in self.rules:
+        # Small businesses finish faster in-process than it takes to pickle the reviews
+        if len(reviews) >= PARALLEL_RULES_MIN_REVIEWS and len(self.rules) > 1:
+            executor = _get_executor(len(self.rules))
+            futures = [executor.submit(rule.analyze, reviews, business_data) for rule in self.rules]
+        else:
+            futures = None
+
+        for i, rule in enumerate(self.rules):
             rule_name = rule.get_name()
             try:
-                result = rule.analyze(reviews, business_data)
+                if futures is not None:
+                    result = futures[i].result()
+                else:
+                    result = rule.analyze(reviews, business_data)
                 results[rule_name] = result
             except Exception as e:
                 # If a rule fails, log error and continue
-                print(f"Error running {rule_name}: {e}")
+                logger.error("Error running %s: %s", rule_name, e)
                 results[rule_name] = {
                     'score': 0.0,
                     'flagged_items': [],
@@ -1,31 +1,55 @@
 """Text similarity detection rule - finds duplicate/copied reviews"""
-from typing import Dict, List
-from itertools import combinations
-from fuzzywuzzy import fuzz
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import heapq
+import math
+from typing import Dict, List, Tuple
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from fraud_detection.base import FraudRule
-from config import TEXT_SIMILARITY_THRESHOLD
+from fraud_detection._kernels import char_histograms, shared_char_counts
+from config import TEXT_SIMILARITY_THRESHOLD, TEXT_SIMILARITY_LSH_MIN_REVIEWS
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    # datasketch is optional - without it every business uses the full matrix
+    MinHash = MinHashLSH = None
+
+# MinHash LSH blocking parameters (Jaccard similarity of character 3-shingles)
+LSH_JACCARD_THRESHOLD = 0.5
+LSH_NUM_PERM = 64
+
+# Rows per cdist call when scoring the length-banded matrix
+MATRIX_BAND_ROWS = 64
 
 
 class TextSimilarityRule(FraudRule):
     """
     Detects duplicate or highly similar reviews
 
-    Uses Levenshtein distance to compare all review pairs.
+    Uses Levenshtein distance (RapidFuzz) to compare all review pairs.
     Flags reviews with >85% similarity as potential fraud.
+
+    For very large businesses the all-pairs matrix is replaced by MinHash LSH
+    blocking, so only pairs with overlapping shingles are scored.
     """
 
-    def __init__(self, threshold: int = TEXT_SIMILARITY_THRESHOLD):
+    def __init__(
+        self,
+        threshold: int = TEXT_SIMILARITY_THRESHOLD,
+        lsh_min_reviews: int = TEXT_SIMILARITY_LSH_MIN_REVIEWS
+    ):
         """
         Args:
             threshold: Similarity percentage threshold (0-100)
+            lsh_min_reviews: Eligible review count at which LSH blocking kicks in
         """
-        self.threshold = threshold
+        # Scores are compared as whole percentages, so a fractional threshold
+        # behaves like the next integer up
+        self.threshold = math.ceil(threshold)
+        # Lowest raw fuzz.ratio that still rounds to the threshold
+        self.min_raw_score = self.threshold - 0.5
+        self.lsh_min_reviews = lsh_min_reviews
 
     def analyze(self, reviews: List[Dict], business_data: Dict) -> Dict:
         """
@@ -45,51 +69,175 @@ class TextSimilarityRule(FraudRule):
                 'reasoning': 'Insufficient reviews for comparison'
             }
 
-        similar_pairs = []
+        # Skip reviews that are too short to compare meaningfully
+        eligible = [r for r in reviews if len(r.get('review_text', '')) >= 20]
+        texts = [r.get('review_text', '') for r in eligible]
 
-        # Compare all review pairs
-        for r1, r2 in combinations(reviews, 2):
-            # Skip if same reviewer (could be legitimate edits)
-            if r1.get('reviewer_id') == r2.get('reviewer_id'):
-                continue
+        # Fields read for every pair, looked up once per review
+        ids = [r.get('id') for r in eligible]
+        reviewer_ids = [r.get('reviewer_id') for r in eligible]
 
-            # Skip if either review is too short
-            text1 = r1.get('review_text', '')
-            text2 = r2.get('review_text', '')
+        # Copy-pasted reviews are compared once: one representative per distinct text
+        groups = {}
+        for idx, text in enumerate(texts):
+            groups.setdefault(text, []).append(idx)
+        unique_texts = list(groups)
+        members = list(groups.values())
 
-            if len(text1) < 20 or len(text2) < 20:
+        if len(unique_texts) >= self.lsh_min_reviews and MinHashLSH is not None:
+            scored_pairs = self._lsh_pairs(unique_texts)
+        else:
+            scored_pairs = self._matrix_pairs(unique_texts)
+
+        # Stream the flagged review pairs: count them all, but only keep the
+        # first 10 (in review order) for display
+        pair_count = 0
+        unique_flagged_reviews = set()
+        first_pairs = []  # max-heap of (-i, -j, similarity), at most 10 entries
+
+        for i, j, similarity in self._expand_pairs(members, scored_pairs):
+            # Skip if same reviewer (could be legitimate edits)
+            if reviewer_ids[i] == reviewer_ids[j]:
                 continue
 
-            # Calculate similarity using fuzzywuzzy
-            similarity = fuzz.ratio(text1, text2)
+            pair_count += 1
+            unique_flagged_reviews.add(ids[i])
+            unique_flagged_reviews.add(ids[j])
 
-            if similarity >= self.threshold:
-                similar_pairs.append({
-                    'review1_id': r1.get('id'),
-                    'review2_id': r2.get('id'),
-                    'similarity': similarity,
-                    'text1': text1[:150],  # First 150 chars for preview
-                    'text2': text2[:150],
-                    'reviewer1': r1.get('reviewer_name', 'Unknown'),
-                    'reviewer2': r2.get('reviewer_name', 'Unknown')
-                })
+            heapq.heappush(first_pairs, (-i, -j, similarity))
+            if len(first_pairs) > 10:
+                heapq.heappop(first_pairs)
 
-        # Calculate score based on percentage of reviews involved
-        unique_flagged_reviews = set()
-        for pair in similar_pairs:
-            unique_flagged_reviews.add(pair['review1_id'])
-            unique_flagged_reviews.add(pair['review2_id'])
+        similar_pairs = []
+        for neg_i, neg_j, similarity in sorted(first_pairs, reverse=True):
+            i, j = -neg_i, -neg_j
+            r1, r2 = eligible[i], eligible[j]
+            similar_pairs.append({
+                'review1_id': ids[i],
+                'review2_id': ids[j],
+                'similarity': int(similarity),
+                'text1': texts[i][:150],  # First 150 chars for preview
+                'text2': texts[j][:150],
+                'reviewer1': r1.get('reviewer_name', 'Unknown'),
+                'reviewer2': r2.get('reviewer_name', 'Unknown')
+            })
 
+        # Calculate score based on percentage of reviews involved
         score = (len(unique_flagged_reviews) / len(reviews)) * 100 if reviews else 0
 
         # Generate reasoning
-        if len(similar_pairs) == 0:
+        if pair_count == 0:
             reasoning = "No duplicate or similar reviews detected"
         else:
-            reasoning = f"Found {len(similar_pairs)} pairs of highly similar reviews (>{self.threshold}% match)"
+            reasoning = f"Found {pair_count} pairs of highly similar reviews (>{self.threshold}% match)"
 
         return {
             'score': min(score, 100.0),
-            'flagged_items': similar_pairs[:10],  # Limit to top 10 for display
+            'flagged_items': similar_pairs,  # First 10 pairs, for display
             'reasoning': reasoning
         }
+
+    @staticmethod
+    def _expand_pairs(members: List[List[int]], scored_pairs: List[Tuple[int, int, float]]):
+        """
+        Yield (i, j, similarity) review pairs (i < j) from distinct-text results
+
+        Reviews with identical text are a 100% match; pairs across two texts
+        take the score of their representatives. Order is unspecified.
+        """
+        for group in members:
+            for a in range(len(group)):
+                for b in range(a + 1, len(group)):
+                    yield group[a], group[b], 100
+        for u, v, similarity in scored_pairs:
+            for i in members[u]:
+                for j in members[v]:
+                    yield min(i, j), max(i, j), similarity
+
+    def _max_partner_length(self, length: int) -> float:
+        """
+        Longest text that can still reach the threshold against one of `length` chars
+
+        fuzz.ratio is at most 200 * min(l1, l2) / (l1 + l2), so for l1 <= l2 a
+        match needs l2 <= l1 * (200 - min_raw_score) / min_raw_score.
+        """
+        if self.min_raw_score <= 0:
+            return float('inf')
+        return length * (200 - self.min_raw_score) / self.min_raw_score
+
+    def _matrix_pairs(self, texts: List[str]) -> List[Tuple[int, int, float]]:
+        """
+        Score candidate pairs with vectorized, multi-core cdist calls
+
+        Texts are sorted by length and scored in bands of rows, each against
+        only the columns whose length can still reach the threshold.
+        """
+        if len(texts) < 2:
+            return []
+
+        lengths = np.array([len(t) for t in texts])
+        order = np.argsort(lengths, kind='stable')
+        sorted_lengths = lengths[order]
+
+        scored_pairs = []
+        for start in range(0, len(texts), MATRIX_BAND_ROWS):
+            rows = order[start:start + MATRIX_BAND_ROWS]
+            stop = np.searchsorted(
+                sorted_lengths, self._max_partner_length(sorted_lengths[start + len(rows) - 1]), side='right'
+            )
+            cols = order[start:stop]
+            if len(cols) < 2:
+                continue
+
+            similarity_matrix = process.cdist(
+                [texts[i] for i in rows], [texts[j] for j in cols],
+                scorer=fuzz.ratio, dtype=np.uint8, workers=-1,
+                score_cutoff=self.min_raw_score  # lets RapidFuzz give up early on hopeless pairs
+            )
+            # Row r and column c are the same sorted position when c == r; keep c > r
+            for r, c in np.argwhere(np.triu(similarity_matrix, 1) >= self.threshold):
+                i, j = sorted((int(rows[r]), int(cols[c])))
+                scored_pairs.append((i, j, similarity_matrix[r, c]))
+
+        return scored_pairs
+
+    def _lsh_pairs(self, texts: List[str]) -> List[Tuple[int, int, float]]:
+        """Score only the pairs that MinHash LSH puts in a shared bucket"""
+        lsh = MinHashLSH(threshold=LSH_JACCARD_THRESHOLD, num_perm=LSH_NUM_PERM)
+        minhashes = []
+        for idx, text in enumerate(texts):
+            shingles = {text[k:k + 3].encode('utf-8') for k in range(len(text) - 2)}
+            minhash = MinHash(num_perm=LSH_NUM_PERM)
+            minhash.update_batch(shingles)
+            lsh.insert(idx, minhash)
+            minhashes.append(minhash)
+
+        candidate_pairs = set()
+        for i, minhash in enumerate(minhashes):
+            for j in lsh.query(minhash):
+                if i < j:
+                    candidate_pairs.add((i, j))
+
+        if not candidate_pairs:
+            return []
+
+        # Cheap upper bounds on fuzz.ratio, for all candidates at once:
+        # length difference, then shared characters
+        pairs = np.array(sorted(candidate_pairs), dtype=np.int64)
+        left, right = pairs[:, 0], pairs[:, 1]
+        lengths = np.array([len(t) for t in texts], dtype=np.int64)
+        l1 = np.minimum(lengths[left], lengths[right])
+        l2 = np.maximum(lengths[left], lengths[right])
+        keep = l2 * self.min_raw_score <= l1 * (200 - self.min_raw_score)
+
+        left, right, l1, l2 = left[keep], right[keep], l1[keep], l2[keep]
+        shared = shared_char_counts(char_histograms(texts), left, right)
+        keep = shared * 200 >= self.min_raw_score * (l1 + l2)
+
+        scored_pairs = []
+        for i, j in zip(left[keep].tolist(), right[keep].tolist()):
+            # Round half up, like cdist's integer output in the matrix path
+            similarity = int(fuzz.ratio(texts[i], texts[j], score_cutoff=self.min_raw_score) + 0.5)
+            if similarity >= self.threshold:
+                scored_pairs.append((i, j, similarity))
+        return scored_pairs
@@ -1,12 +1,8 @@
 """Timing analysis rule - detects review clusters posted simultaneously"""
+import heapq
 from typing import Dict, List
-from datetime import datetime
-from collections import defaultdict
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from datetime import datetime, timezone
+import numpy as np
 
 from fraud_detection.base import FraudRule
 
@@ -33,7 +29,7 @@ class TimingAnalysisRule(FraudRule):
         Returns:
             {
                 'score': 0-100 (percentage of reviews in suspicious clusters),
-                'flagged_items': [{'timestamp', 'count', 'review_ids', 'reviewers'}],
+                'flagged_items': [{'timestamp' (datetime, to the minute), 'count', 'review_ids', 'reviewers'}],
                 'reasoning': str
             }
         """
@@ -44,8 +40,9 @@ class TimingAnalysisRule(FraudRule):
                 'reasoning': 'Insufficient reviews for timing analysis'
             }
 
-        # Group reviews by minute-level timestamp
-        timestamp_buckets = defaultdict(list)
+        # Every review with a usable timestamp
+        dated_reviews = []
+        timestamps = []
 
         for review in reviews:
             timestamp = review.get('review_date')
@@ -59,34 +56,51 @@ class TimingAnalysisRule(FraudRule):
             elif not isinstance(timestamp, datetime):
                 continue
 
-            # Round to minute (remove seconds and microseconds)
-            minute_timestamp = timestamp.replace(second=0, microsecond=0)
-            timestamp_buckets[minute_timestamp].append(review)
+            dated_reviews.append(review)
+            timestamps.append(timestamp)
+
+        # Round to minute in one pass. Aware timestamps are compared in UTC and
+        # never share a bucket with naive ones (same as comparing datetimes)
+        is_aware = np.array([t.tzinfo is not None for t in timestamps], dtype=np.int64)
+        minutes = np.array(
+            [t.astimezone(timezone.utc).replace(tzinfo=None) if t.tzinfo else t for t in timestamps],
+            dtype='datetime64[us]'
+        ).astype('datetime64[m]')
+        minute_keys = minutes.astype(np.int64) * 2 + is_aware
+
+        _, first_index, inverse, counts = np.unique(
+            minute_keys, return_index=True, return_inverse=True, return_counts=True
+        )
+
+        # Flagged buckets in the order they first appear
+        flagged = np.flatnonzero(counts >= self.min_cluster_size)
+        flagged = flagged[np.argsort(first_index[flagged], kind='stable')]
 
-        # Find clusters (multiple reviews in same minute)
+        # Only the 10 largest clusters (the ones we display) are materialized;
+        # nlargest keeps first-appearance order among equal counts
         clusters = []
-        for timestamp, reviews_in_bucket in timestamp_buckets.items():
-            if len(reviews_in_bucket) >= self.min_cluster_size:
-                clusters.append({
-                    'timestamp': timestamp.isoformat(),
-                    'count': len(reviews_in_bucket),
-                    'review_ids': [r.get('id') for r in reviews_in_bucket],
-                    'reviewers': [r.get('reviewer_name', 'Unknown') for r in reviews_in_bucket]
-                })
+        for bucket in heapq.nlargest(10, flagged, key=lambda k: counts[k]):
+            bucket_reviews = [dated_reviews[i] for i in np.flatnonzero(inverse == bucket)]
+            clusters.append({
+                'timestamp': timestamps[first_index[bucket]].replace(second=0, microsecond=0),
+                'count': len(bucket_reviews),
+                'review_ids': [r.get('id') for r in bucket_reviews],
+                'reviewers': [r.get('reviewer_name', 'Unknown') for r in bucket_reviews]
+            })
 
         # Calculate score based on percentage of reviews in clusters
-        reviews_in_clusters = sum(c['count'] for c in clusters)
+        reviews_in_clusters = int(counts[flagged].sum())
         score = (reviews_in_clusters / len(reviews)) * 100 if reviews else 0
 
         # Generate reasoning
-        if len(clusters) == 0:
+        if len(flagged) == 0:
             reasoning = "No suspicious timing patterns detected"
         else:
-            max_cluster = max(clusters, key=lambda c: c['count'])
-            reasoning = f"Found {len(clusters)} timing clusters. Largest cluster: {max_cluster['count']} reviews posted at {max_cluster['timestamp']}"
+            max_cluster = clusters[0]
+            reasoning = f"Found {len(flagged)} timing clusters. Largest cluster: {max_cluster['count']} reviews posted at {max_cluster['timestamp'].isoformat()}"
 
         return {
             'score': min(score, 100.0),
-            'flagged_items': sorted(clusters, key=lambda c: c['count'], reverse=True)[:10],  # Top 10 clusters
+            'flagged_items': clusters,  # Top 10 clusters
             'reasoning': reasoning
         }
@@ -1,5 +1,12 @@
 """Fraud scoring system - combines rule results into final score"""
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Rule weights (must sum to 1.0)
+WEIGHTS = {
+    'TextSimilarityRule': 0.6,      # 60% - Most reliable indicator
+    'TimingAnalysisRule': 0.4,      # 40% - Strong indicator
+}
 
 
 class FraudScorer:
@@ -9,11 +16,7 @@ class FraudScorer:
     For POC, using simple 50/50 split between Text Similarity and Timing Analysis
     """
 
-    # Rule weights (must sum to 1.0)
-    WEIGHTS = {
-        'TextSimilarityRule': 0.6,      # 60% - Most reliable indicator
-        'TimingAnalysisRule': 0.4,      # 40% - Strong indicator
-    }
+    WEIGHTS = WEIGHTS
 
     def calculate_score(self, rule_results: Dict) -> Dict:
         """
@@ -31,43 +34,66 @@ class FraudScorer:
                 'total_reviews_analyzed': int
             }
         """
-        weighted_sum = 0.0
-        breakdown = {}
-
-        # Calculate weighted score
-        for rule_name, result in rule_results.items():
-            weight = self.WEIGHTS.get(rule_name, 0)
-            score = result.get('score', 0)
-            contribution = score * weight
+        # Scoring only depends on each rule's score and reasoning, so re-scoring
+        # an unchanged business is a cache hit
+        key = tuple(
+            (rule_name, result.get('score', 0), result.get('reasoning', ''))
+            for rule_name, result in rule_results.items()
+        )
+        overall_score, breakdown, reasoning = _score_rules(tuple(self.WEIGHTS.items()), key)
 
-            weighted_sum += contribution
+        # Fresh containers so callers can't modify the cached entry
+        return {
+            'overall_score': overall_score,
+            'risk_level': self._get_risk_level(overall_score),
+            'breakdown': {rule_name: dict(data) for rule_name, data in breakdown},
+            'reasoning': list(reasoning)
+        }
 
-            breakdown[rule_name] = {
-                'score': round(score, 1),
-                'weight': weight,
-                'contribution': round(contribution, 1),
-                'reasoning': result.get('reasoning', '')
-            }
+    def report_summary(
+        self,
+        text_similarity_score: float,
+        timing_burst_score: float,
+        overall_score: float
+    ) -> Dict:
+        """
+        Build the breakdown shown on the report page from the stored scores
 
-        # Sort by contribution to identify main fraud indicators
-        sorted_rules = sorted(
-            breakdown.items(),
-            key=lambda x: x[1]['contribution'],
-            reverse=True
-        )
+        Computed once when the analysis is saved (and stored as breakdown_json),
+        so /report doesn't redo it on every page load.
 
-        # Generate primary reasoning (top contributors with score > 10)
+        Returns:
+            {
+                'overall_score': float,
+                'risk_level': str,
+                'breakdown': {rule_name: {'score', 'weight', 'contribution', 'reasoning'}},
+                'reasoning': [list of display strings]
+            }
+        """
+        breakdown = {}
         reasoning = []
-        for rule_name, data in sorted_rules:
-            if data['score'] > 10:  # Only include significant contributors
-                # Clean up rule name for display
-                display_name = rule_name.replace('Rule', '')
-                reasoning.append(f"{display_name}: {data['reasoning']}")
 
-        if not reasoning:
-            reasoning.append("No significant fraud indicators detected")
+        if text_similarity_score > 0:
+            weight = self.WEIGHTS.get('TextSimilarityRule', 0)
+            breakdown['TextSimilarityRule'] = {
+                'score': text_similarity_score,
+                'weight': weight,
+                'contribution': round(text_similarity_score * weight, 1),
+                'reasoning': 'Text similarity analysis'
+            }
+            if text_similarity_score > 10:
+                reasoning.append(f"Text Similarity: {text_similarity_score:.1f}% of reviews are similar")
 
-        overall_score = round(weighted_sum, 1)
+        if timing_burst_score > 0:
+            weight = self.WEIGHTS.get('TimingAnalysisRule', 0)
+            breakdown['TimingAnalysisRule'] = {
+                'score': timing_burst_score,
+                'weight': weight,
+                'contribution': round(timing_burst_score * weight, 1),
+                'reasoning': 'Timing cluster analysis'
+            }
+            if timing_burst_score > 10:
+                reasoning.append(f"Timing Clusters: {timing_burst_score:.1f}% of reviews in suspicious clusters")
 
         return {
             'overall_score': overall_score,
@@ -76,7 +102,9 @@ class FraudScorer:
             'reasoning': reasoning
         }
 
-    def _get_risk_level(self, score: float) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_risk_level(score: float) -> str:
         """
         Convert numeric score to risk level
 
@@ -94,3 +122,58 @@ class FraudScorer:
             return 'LOW'
         else:
             return 'MINIMAL'
+
+
+@lru_cache(maxsize=1024)
+def _score_rules(
+    weights: Tuple[Tuple[str, float], ...],
+    rule_scores: Tuple[Tuple[str, float, str], ...]
+) -> Tuple[float, Tuple, Tuple[str, ...]]:
+    """
+    Weighted score, breakdown and reasoning for FraudScorer.calculate_score
+
+    Args:
+        weights: FraudScorer.WEIGHTS items
+        rule_scores: (rule_name, score, reasoning) per rule, in rule order
+
+    Returns:
+        (overall_score, ((rule_name, breakdown_entry), ...), reasoning strings)
+    """
+    weights = dict(weights)
+    weighted_sum = 0.0
+    breakdown = {}
+
+    # Calculate weighted score
+    for rule_name, score, rule_reasoning in rule_scores:
+        weight = weights.get(rule_name, 0)
+        contribution = score * weight
+
+        weighted_sum += contribution
+
+        breakdown[rule_name] = {
+            'score': round(score, 1),
+            'weight': weight,
+            'contribution': round(contribution, 1),
+            'reasoning': rule_reasoning
+        }
+
+    # Sort by contribution to identify main fraud indicators
+    sorted_rules = sorted(
+        breakdown.items(),
+        key=lambda x: x[1]['contribution'],
+        reverse=True
+    )
+
+    # Generate primary reasoning (top contributors with score > 10)
+    reasoning = []
+    for rule_name, data in sorted_rules:
+        if data['score'] > 10:  # Only include significant contributors
+            # Clean up rule name for display
+            display_name = rule_name.replace('Rule', '')
+            reasoning.append(f"{display_name}: {data['reasoning']}")
+
+    if not reasoning:
+        reasoning.append("No significant fraud indicators detected")
+
+    # Cap at 100 (analysis_results.fraud_score has a CHECK for 0-100)
+    return round(min(weighted_sum, 100.0), 1), tuple(breakdown.items()), tuple(reasoning)
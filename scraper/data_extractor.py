@@ -3,6 +3,14 @@ import re
 from datetime import datetime
 from typing import Dict, Any
 
+# Compiled once at import - these run for every scraped review
+_WS_RE = re.compile(r'\s+')
+_NUM_RE = re.compile(r'(\d+)')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+# str.translate table that deletes Hebrew characters (U+0590 to U+05FF)
+_HEBREW_TABLE = dict.fromkeys(range(0x0590, 0x0600))
+
 
 def clean_text(text: str) -> str:
     """
@@ -16,7 +24,7 @@ def clean_text(text: str) -> str:
         return ""
 
     # Remove extra whitespace
-    text = re.sub(r'\\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
 
     # Strip
     text = text.strip()
@@ -40,7 +48,7 @@ def extract_number_from_text(text: str) -> int:
     text = text.replace(',', '')
 
     # Find first number
-    match = re.search(r'(\\d+)', text)
+    match = _NUM_RE.search(text)
     if match:
         return int(match.group(1))
 
@@ -56,8 +64,9 @@ def is_hebrew_text(text: str) -> bool:
     if not text:
         return False
 
-    hebrew_chars = sum(1 for c in text if '\\u0590' <= c <= '\\u05FF')
+    # Count by deleting Hebrew characters in C rather than looping in Python
     total_chars = len(text)
+    hebrew_chars = total_chars - len(text.translate(_HEBREW_TABLE))
 
     if total_chars == 0:
         return False
@@ -77,8 +86,8 @@ def normalize_business_name(name: str) -> str:
         return ""
 
     name = name.lower()
-    name = re.sub(r'[^a-z0-9\\s]', '', name)
-    name = re.sub(r'\\s+', ' ', name)
+    name = _NON_ALNUM_RE.sub('', name)
+    name = _WS_RE.sub(' ', name)
     name = name.strip()
 
     return name
@@ -0,0 +1,31 @@
+"""Records produced by the Google Maps scraper"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class BusinessInfo:
+    """Business header data from a Google Maps place page"""
+    name: Optional[str] = None
+    address: Optional[str] = None
+    category: Optional[str] = None
+    total_reviews: int = 0
+    average_rating: float = 0.0
+
+
+@dataclass(slots=True)
+class ReviewRecord:
+    """
+    One scraped review
+
+    Slotted, so the thousands of these held during a scrape carry no per-object
+    __dict__. scrape_business returns them as-is; the app turns each one
+    straight into its database row.
+    """
+    text: str
+    rating: int  # 1-5
+    timestamp: datetime
+    reviewer_name: str
+    reviewer_total_reviews: int
+    language: str  # 'he' or 'en'
@@ -0,0 +1,66 @@
+"""Runtime patches for Playwright internals"""
+import importlib
+import inspect
+import logging
+import os
+import types
+
+logger = logging.getLogger(__name__)
+
+# Playwright _impl modules that call inspect.stack() on the hot path:
+# _connection on every protocol call, _network on every route.continue_() /
+# route.abort() (i.e. every request through block_assets), _sync_base on every
+# sync API call. _path_utils also calls it but needs the real caller frame and
+# only runs at import time, so it is deliberately left alone.
+STACK_CAPTURE_MODULES = ('_connection', '_network', '_sync_base')
+
+
+def disable_stack_capture() -> bool:
+    """
+    Stop Playwright from calling inspect.stack() on every API call
+
+    Playwright records the caller's full stack for each protocol call so it can
+    label errors and traces. inspect.stack() reads source lines for every frame
+    and is a large share of the scraper's CPU time. We only replace the
+    `inspect` reference inside the Playwright modules listed in
+    STACK_CAPTURE_MODULES, so the rest of the process is unaffected; errors
+    simply lose the API-name prefix.
+
+    Set PW_INSPECT_STACK=1 to keep Playwright's default behaviour.
+
+    Returns:
+        True if the patch was applied
+
+    Raises:
+        RuntimeError: If a patched module is gone or no longer imports
+            `inspect`, i.e. a Playwright upgrade moved the call site
+    """
+    if os.environ.get('PW_INSPECT_STACK', '0') != '0':
+        return False
+
+    try:
+        import playwright._impl  # noqa: F401
+    except ImportError as e:
+        logger.warning(f"Could not patch Playwright stack capture: {e}")
+        return False
+
+    patched_inspect = types.ModuleType('inspect')
+    patched_inspect.__dict__.update(vars(inspect))
+    patched_inspect.stack = lambda *args, **kwargs: []
+
+    for name in STACK_CAPTURE_MODULES:
+        try:
+            module = importlib.import_module(f'playwright._impl.{name}')
+        except ImportError as e:
+            raise RuntimeError(
+                f"playwright._impl.{name} is gone; update STACK_CAPTURE_MODULES "
+                f"or set PW_INSPECT_STACK=1"
+            ) from e
+        if not isinstance(getattr(module, 'inspect', None), types.ModuleType):
+            raise RuntimeError(
+                f"playwright._impl.{name} no longer imports inspect; update "
+                f"STACK_CAPTURE_MODULES or set PW_INSPECT_STACK=1"
+            )
+        module.inspect = patched_inspect
+
+    return True
@@ -5,18 +5,227 @@ import re
 import sys
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from playwright.async_api import async_playwright, Page, Browser
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from dataclasses import asdict
+from typing import AsyncIterator, Dict, List, Optional, Union
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Error as PlaywrightError
 import logging
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import MAX_REVIEWS_TO_SCRAPE
+from scraper.models import BusinessInfo, ReviewRecord
+from config import MAX_REVIEWS_TO_SCRAPE, USER_AGENT, BROWSER_POOL_SIZE, SCRAPE_CONCURRENCY
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_REL_TIME_RE = re.compile(r'(\d+)\s+(second|minute|hour|day|week|month|year)')
+_RATING_RE = re.compile(r'(\d+) star')
+_AVG_RATING_RE = re.compile(r'(\d+\.\d+)')
+_COUNT_RE = re.compile(r'([\d,]+)')
+_REVIEWER_COUNT_RE = re.compile(r'([\d,]+)\s+review', re.IGNORECASE)
+
+# str.translate table that deletes Hebrew characters (U+0590 to U+05FF)
+_HEBREW_TABLE = dict.fromkeys(range(0x0590, 0x0600))
+
+# Requests the scraper never needs: only the text DOM matters. Stylesheets are
+# kept - the reviews feed only scrolls (and lazy-loads) with its CSS applied
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+TRACKER_RE = re.compile(r'analytics|doubleclick|googletagmanager')
+
+
+# Runs inside the page against the reviews container: scrolls it until no new
+# cards load (or maxReviews / maxScrolls is reached), expanding truncated
+# reviews and collecting the raw fields of every card. The whole
+# infinite-scroll loop costs a single CDP round-trip.
+_SCROLL_AND_COLLECT_JS = """
+async (container, {selector, maxReviews, maxScrolls, timeout}) => {
+    const text = (card, sel) => {
+        const el = card.querySelector(sel);
+        return el ? el.textContent : null;
+    };
+
+    const readCard = card => {
+        const rating = card.querySelector('span.kvMYJc');
+        const reviewer = card.querySelector('button.WEBjve');
+        return {
+            name: text(card, 'div.d4r55'),
+            rating_aria: rating ? rating.getAttribute('aria-label') : null,
+            text: text(card, 'span.wiI7pd'),
+            time_text: text(card, 'span.rsqaWe'),
+            // "N reviews" is shown inline on the card or in the reviewer button's label
+            reviewer_reviews: text(card, 'div.RfnDt') || (reviewer ? reviewer.getAttribute('aria-label') : null)
+        };
+    };
+
+    // Resolve once `done()` holds or after `ms`, re-checking on every DOM mutation
+    const waitFor = (done, ms, options) => new Promise(resolve => {
+        if (done()) return resolve();
+        const finish = () => { observer.disconnect(); clearTimeout(timer); resolve(); };
+        const observer = new MutationObserver(() => { if (done()) finish(); });
+        const timer = setTimeout(finish, ms);
+        observer.observe(container, options);
+    });
+
+    // Click every "More" button, then wait until they have all been replaced
+    // by the expanded text (or give up after a second)
+    const expand = cards => {
+        const buttons = cards.map(card => card.querySelector('button.w8nwRe')).filter(Boolean);
+        buttons.forEach(button => button.click());
+        const expanded = () => buttons.every(button => !button.isConnected || button.offsetParent === null);
+        return waitFor(expanded, 1000, {childList: true, subtree: true, attributes: true});
+    };
+
+    const rows = [];
+    let seen = 0;
+    let idleScrolls = 0;
+    for (let scroll = 0; scroll < maxScrolls; scroll++) {
+        // Never expand or read more cards than are still wanted
+        const fresh = Array.from(container.querySelectorAll(selector)).slice(seen, seen + maxReviews - rows.length);
+        await expand(fresh);
+        rows.push(...fresh.map(readCard));
+        seen += fresh.length;
+        if (rows.length >= maxReviews) break;
+
+        // Stop after 3 scrolls in a row that load nothing new
+        idleScrolls = fresh.length ? 0 : idleScrolls + 1;
+        if (idleScrolls >= 3) break;
+
+        // Scroll to the bottom and wait for the next page of cards
+        container.scrollTop = container.scrollHeight;
+        await waitFor(() => container.querySelectorAll(selector).length > seen, timeout, {childList: true, subtree: true});
+    }
+    return {count: seen, rows};
+}
+"""
+
+# Raw header fields of a place page, read in one call
+_BUSINESS_FIELDS_JS = """
+() => {
+    const rating = document.querySelector('span.ceNzKf');
+    const reviews = document.querySelector('span.F7nice');
+    const address = document.querySelector('button[data-item-id="address"]');
+    return {
+        rating_aria: rating ? rating.getAttribute('aria-label') : null,
+        reviews_text: reviews ? reviews.textContent : null,
+        address: address ? address.getAttribute('aria-label') : null
+    };
+}
+"""
+
+# Business name heading; once it exists the place page has rendered
+BUSINESS_NAME_SELECTOR = 'h1.DUwDvf, h1[class*="fontHeadline"], h1'
+
+# Scrollable reviews list shown after opening the Reviews tab
+REVIEWS_FEED_SELECTOR = 'div[role="feed"], div.m6QErb'
+
+# Candidates for the Reviews tab, most specific first. The last entry is the
+# fallback: every clickable element on the page
+REVIEW_TAB_SELECTORS = [
+    # Specific aria-labels
+    'button[aria-label*="Reviews"]',
+    'button[aria-label*="ביקורות"]',  # Hebrew
+    # Tabs and buttons (matched on their text below)
+    '[role="tab"]',
+    'button.hh2c6',
+    'button[jsaction*="review"]',
+    'div.RWPxGd button',
+    'button[data-tab-index]',
+    'button',
+    'button, div[role="tab"], div[role="button"], span[role="button"], [onclick], [jsaction]',
+]
+
+# Walks REVIEW_TAB_SELECTORS in the page and finds the first element whose
+# text mentions reviews (English or Hebrew). Returns {element, selector, index,
+# text} - the index is into document.querySelectorAll(selector) - or null
+_FIND_REVIEWS_TAB_JS = """
+(selectors) => {
+    const isReviews = text => text.includes('ביקורות') || text.toLowerCase().includes('review');
+    for (const selector of selectors) {
+        const elements = document.querySelectorAll(selector);
+        for (let index = 0; index < elements.length; index++) {
+            const el = elements[index];
+            const text = (el.textContent || '').trim();
+            if (isReviews(text) || isReviews(el.innerText || '')) {
+                return {element: el, selector, index, text: text.slice(0, 50)};
+            }
+        }
+    }
+    return null;
+}
+"""
+
+
+async def _launch_browser(playwright, headless: bool) -> Browser:
+    """Launch Chromium with the flags used for all scraping"""
+    return await playwright.chromium.launch(
+        headless=headless,
+        args=[
+            '--disable-blink-features=AutomationControlled',
+            '--disable-dev-shm-usage',
+            '--disable-gpu',
+            '--disable-background-networking',
+            '--disable-extensions',
+        ]
+    )
+
+
+async def block_assets(route):
+    """Abort images, media, fonts and trackers"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or TRACKER_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    Long-lived Chromium shared by all scrapes in the process
+
+    Launching Chromium costs several seconds, so the browser is started once
+    and every scrape only opens its own (cheap, isolated) BrowserContext.
+    A semaphore caps how many contexts run at the same time.
+    """
+
+    def __init__(self, headless: bool = True, max_contexts: int = BROWSER_POOL_SIZE):
+        self.headless = headless
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self._semaphore = asyncio.Semaphore(max_contexts)
+
+    async def start(self):
+        """Launch the shared browser"""
+        self.playwright = await async_playwright().start()
+        self.browser = await _launch_browser(self.playwright, self.headless)
+        logger.info("Browser pool started")
+
+    async def close(self):
+        """Close the shared browser"""
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+        self.browser = None
+        self.playwright = None
+        logger.info("Browser pool closed")
+
+    @asynccontextmanager
+    async def scraper(self) -> AsyncIterator['GoogleMapsScraper']:
+        """Yield a GoogleMapsScraper running in a fresh context of the shared browser"""
+        async with self._semaphore:
+            if not self.browser or not self.browser.is_connected():
+                await self.close()
+                await self.start()
+            scraper = GoogleMapsScraper(headless=self.headless)
+            await scraper.initialize(browser=self.browser)
+            try:
+                yield scraper
+            finally:
+                await scraper.close()
+
 
 class GoogleMapsScraper:
     """Scraper for Google Maps reviews using Playwright"""
@@ -24,35 +233,56 @@ class GoogleMapsScraper:
     def __init__(self, headless: bool = True):
         self.headless = headless
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.playwright = None
+        self._owns_browser = False
 
-    async def initialize(self):
-        """Launch Playwright browser"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=['--disable-blink-features=AutomationControlled']
-        )
+    async def initialize(self, browser: Optional[Browser] = None):
+        """
+        Open a browser context and page
+
+        Args:
+            browser: Already-running browser to reuse (e.g. from BrowserPool).
+                     If omitted, a dedicated Chromium is launched and closed
+                     together with this scraper.
+        """
+        if browser is None:
+            self.playwright = await async_playwright().start()
+            browser = await _launch_browser(self.playwright, self.headless)
+            self._owns_browser = True
+        self.browser = browser
 
-        context = await self.browser.new_context(
+        self.context = await self.browser.new_context(
             locale='en-US',
             timezone_id='America/New_York',
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            user_agent=USER_AGENT,
+            viewport={'width': 1024, 'height': 768}
         )
+        await self.context.route('**/*', block_assets)
 
-        self.page = await context.new_page()
+        self.page = await self.context.new_page()
         logger.info("Browser initialized successfully")
 
     async def close(self):
-        """Close browser and cleanup"""
+        """Close browser context and, if we launched it, the browser itself"""
         if self.page:
             await self.page.close()
-        if self.browser:
+        if self.context:
+            await self.context.close()
+        if self._owns_browser:
             await self.browser.close()
-        if self.playwright:
             await self.playwright.stop()
-        logger.info("Browser closed")
+            logger.info("Browser closed")
+        self.page = None
+        self.context = None
+
+    async def __aenter__(self) -> 'GoogleMapsScraper':
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     async def scrape_business(self, url: str) -> Dict:
         """
@@ -64,7 +294,7 @@ class GoogleMapsScraper:
         Returns:
             {
                 'business': {name, address, category, total_reviews, average_rating},
-                'reviews': [{text, rating, timestamp, reviewer_name, reviewer_total_reviews, language}, ...]
+                'reviews': [ReviewRecord, ...]
             }
         """
         if not self.page:
@@ -74,31 +304,36 @@ class GoogleMapsScraper:
 
         # Navigate to URL
         await self.page.goto(url, wait_until='domcontentloaded', timeout=60000)
-        await self._random_delay(3, 5)
 
-        # Take screenshot for debugging
-        await self.page.screenshot(path='debug_after_load.png')
-        logger.info("Screenshot saved: debug_after_load.png")
+        # The page is usable once the business name has rendered
+        try:
+            await self.page.wait_for_selector(BUSINESS_NAME_SELECTOR, timeout=15000)
+        except Exception as e:
+            logger.warning(f"Business name did not appear: {e}")
+
+        await self._debug_screenshot('debug_after_load.png')
 
         # Extract business info
         business_data = await self._extract_business_info()
-        logger.info(f"Business: {business_data['name']}")
+        logger.info(f"Business: {business_data.name}")
 
         # Try multiple approaches to get to reviews section
         logger.info("Attempting to navigate to reviews section...")
 
-        # WAIT for page to fully load including dynamic content
-        logger.info("Waiting for page to fully load (5 seconds)...")
-        await asyncio.sleep(5)  # Give dynamic content time to load
+        # The tab strip is rendered after the header - wait for it, not a fixed time
+        try:
+            await self.page.wait_for_selector('[role="tab"]', timeout=10000)
+        except Exception as e:
+            logger.warning(f"Tabs did not appear: {e}")
 
         # Method 1: Click Reviews tab
         reviews_visible = False
         try:
             clicked = await self._click_reviews_tab()
             if clicked:
-                await self._random_delay(2, 3)
-                await self.page.screenshot(path='debug_after_click.png')
-                logger.info("✓ Clicked Reviews tab, screenshot saved")
+                await self.page.wait_for_selector(REVIEWS_FEED_SELECTOR, timeout=10000)
+                await self._debug_screenshot('debug_after_click.png')
+                logger.info("✓ Clicked Reviews tab")
                 reviews_visible = True
         except Exception as e:
             logger.warning(f"Method 1 failed: {e}")
@@ -108,7 +343,7 @@ class GoogleMapsScraper:
             logger.info("Trying to scroll to find reviews...")
             try:
                 await self.page.evaluate('window.scrollTo(0, 800)')
-                await self._random_delay(1, 2)
+                await self.page.wait_for_selector(REVIEWS_FEED_SELECTOR, timeout=5000)
             except Exception as e:
                 logger.warning(f"Scroll failed: {e}")
 
@@ -124,19 +359,52 @@ class GoogleMapsScraper:
         logger.info(f"Scraped {len(reviews)} reviews")
 
         return {
-            'business': business_data,
+            'business': asdict(business_data),
             'reviews': reviews
         }
 
-    async def _extract_business_info(self) -> Dict:
+    async def scrape_businesses(
+        self, urls: List[str], concurrency: int = SCRAPE_CONCURRENCY
+    ) -> List[Union[Dict, BaseException]]:
+        """
+        Scrape several businesses concurrently
+
+        All pages share this scraper's browser context; at most `concurrency`
+        pages are open at once. Each task starts with a short jittered delay so
+        the requests don't hit Google Maps in lockstep.
+
+        Returns:
+            List of scrape_business() results, in the same order as `urls`.
+            A URL that failed has its exception in its slot instead, so one
+            bad page doesn't throw away the rest of the batch.
+        """
+        if not self.context:
+            await self.initialize()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_one(url: str) -> Dict:
+            async with semaphore:
+                await self._random_delay(0.1, 0.3)
+                worker = self._fork(await self.context.new_page())
+                try:
+                    return await worker.scrape_business(url)
+                finally:
+                    await worker.page.close()
+
+        return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+
+    def _fork(self, page: Page) -> 'GoogleMapsScraper':
+        """Create a scraper that drives `page` inside this scraper's context"""
+        worker = GoogleMapsScraper(headless=self.headless)
+        worker.browser = self.browser
+        worker.context = self.context
+        worker.page = page
+        return worker
+
+    async def _extract_business_info(self) -> BusinessInfo:
         """Extract business name, address, rating, etc."""
-        business_data = {
-            'name': None,
-            'address': None,
-            'category': None,
-            'total_reviews': 0,
-            'average_rating': 0.0
-        }
+        business_data = BusinessInfo()
 
         try:
             # Business name - try multiple selectors
@@ -150,41 +418,28 @@ class GoogleMapsScraper:
                 try:
                     name_elem = await self.page.wait_for_selector(selector, timeout=5000)
                     if name_elem:
-                        business_data['name'] = await name_elem.text_content()
+                        business_data.name = await name_elem.text_content()
                         break
                 except:
                     continue
 
+            # Rating, review count and address in one round-trip
+            fields = await self.page.evaluate(_BUSINESS_FIELDS_JS)
+
             # Average rating
-            try:
-                rating_elem = await self.page.query_selector('span.ceNzKf')
-                if rating_elem:
-                    rating_text = await rating_elem.get_attribute('aria-label')
-                    if rating_text:
-                        rating_match = re.search(r'(\\d+\\.\\d+)', rating_text)
-                        if rating_match:
-                            business_data['average_rating'] = float(rating_match.group(1))
-            except Exception as e:
-                logger.warning(f"Could not extract rating: {e}")
+            if fields['rating_aria']:
+                rating_match = _AVG_RATING_RE.search(fields['rating_aria'])
+                if rating_match:
+                    business_data.average_rating = float(rating_match.group(1))
 
             # Total reviews count
-            try:
-                reviews_elem = await self.page.query_selector('span.F7nice')
-                if reviews_elem:
-                    reviews_text = await reviews_elem.text_content()
-                    reviews_match = re.search(r'([\\d,]+)', reviews_text)
-                    if reviews_match:
-                        business_data['total_reviews'] = int(reviews_match.group(1).replace(',', ''))
-            except Exception as e:
-                logger.warning(f"Could not extract review count: {e}")
+            if fields['reviews_text']:
+                reviews_match = _COUNT_RE.search(fields['reviews_text'])
+                if reviews_match:
+                    business_data.total_reviews = int(reviews_match.group(1).replace(',', ''))
 
             # Address
-            try:
-                address_elem = await self.page.query_selector('button[data-item-id="address"]')
-                if address_elem:
-                    business_data['address'] = await address_elem.get_attribute('aria-label')
-            except Exception as e:
-                logger.warning(f"Could not extract address: {e}")
+            business_data.address = fields['address']
 
         except Exception as e:
             logger.error(f"Error extracting business info: {e}")
@@ -196,107 +451,28 @@ class GoogleMapsScraper:
         Click the Reviews tab to show reviews
         Returns True if successfully clicked, False otherwise
         """
-        # Try to find and click "Reviews" button/tab (English + Hebrew)
-        # Note: May be button, div, or other element
-        review_button_selectors = [
-            # Specific aria-labels
-            'button[aria-label*="Reviews"]',
-            'button[aria-label*="ביקורות"]',  # Hebrew
-            # Role=tab with text (most reliable)
-            '[role="tab"]:has-text("ביקורות")',  # Hebrew reviews tab
-            '[role="tab"]:has-text("Reviews")',  # English reviews tab
-            # has-text for buttons
-            'button:has-text("ביקורות")',  # Hebrew
-            'button:has-text("Reviews")',  # English
-            # Generic tab buttons
-            'button.hh2c6',
-            'button[jsaction*="review"]',
-            # Clickable divs
-            'div[role="tab"]:has-text("Reviews")',
-            'div[role="tab"]:has-text("ביקורות")',
-            # Tab containers
-            'div.RWPxGd button',
-            'button[data-tab-index]',
-            # Try ANY element with reviews text (last resort)
-            '*:has-text("ביקורות")',
-        ]
-
-        logger.info("Searching for Reviews button...")
-        for selector in review_button_selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                logger.info(f"  Selector '{selector}': found {len(elements)} elements")
-
-                # Check ALL matching elements, not just the first one
-                for i, button in enumerate(elements):
-                    try:
-                        text = await button.text_content()
-                        text = text.strip().lower() if text else ""
-                        logger.info(f"    Element {i}: text = '{text}'")
-
-                        # Only click if text contains "review" or Hebrew "ביקורות"
-                        if 'review' in text or 'ביקורות' in text:
-                            await button.click()
-                            logger.info(f"✓ Clicked Reviews tab using '{selector}' (text: '{text}')")
-                            return True
-                        else:
-                            logger.debug(f"    Skipping (not a reviews button)")
-                    except Exception as e:
-                        logger.debug(f"    Element {i} error: {e}")
-                        continue
-
-            except Exception as e:
-                logger.debug(f"  Selector '{selector}' failed: {e}")
-                continue
-
-        # FALLBACK: Get ALL clickable elements and check manually
-        logger.info("Trying fallback: checking ALL clickable elements...")
+        logger.debug("Searching for Reviews button...")
+        handle = await self.page.evaluate_handle(_FIND_REVIEWS_TAB_JS, REVIEW_TAB_SELECTORS)
         try:
-            # Get all buttons, divs, spans that might be clickable
-            all_clickables = await self.page.query_selector_all('button, div[role="tab"], div[role="button"], span[role="button"], [onclick], [jsaction]')
-            logger.info(f"  Found {len(all_clickables)} clickable elements total")
-
-            # Log ALL element texts that contain Hebrew characters
-            logger.info("  Logging ALL elements with Hebrew text:")
-            hebrew_count = 0
-            for i, elem in enumerate(all_clickables):
+            match = await handle.evaluate(
+                "m => m && {selector: m.selector, index: m.index, text: m.text}"
+            )
+            if match:
+                # A real (trusted) click - some tabs ignore el.click() from script.
+                # Click the element the page picked: re-querying by selector can
+                # land on another one (shadow roots, re-render in between)
+                element = (await handle.get_property('element')).as_element()
                 try:
-                    text = await elem.text_content()
-                    text = text.strip()[:100] if text else ""
-                    # Check if contains Hebrew characters
-                    has_hebrew = any('\u0590' <= c <= '\u05FF' for c in text)
-                    if has_hebrew and text:
-                        logger.info(f"    [{i}] '{text}'")
-                        hebrew_count += 1
-                        # Stop after 50 to avoid spam
-                        if hebrew_count >= 50:
-                            break
-                except:
-                    pass
-            logger.info(f"  Found {hebrew_count} elements with Hebrew text")
-
-            for i, elem in enumerate(all_clickables):
-                try:
-                    # Get BOTH text_content and inner_text (different methods)
-                    text_content = await elem.text_content()
-                    inner_text = await elem.inner_text() if elem else ""
-
-                    # Clean up both texts
-                    text_content = text_content.strip() if text_content else ""
-                    inner_text = inner_text.strip() if inner_text else ""
-
-                    # Check both versions (don't lowercase Hebrew!)
-                    if ('ביקורות' in text_content or 'ביקורות' in inner_text or
-                        'review' in text_content.lower() or 'review' in inner_text.lower()):
-                        logger.info(f"  ✓ FOUND IT! Element {i}: text_content='{text_content[:50]}', inner_text='{inner_text[:50]}'")
-                        await elem.click()
-                        logger.info(f"✓ Clicked Reviews tab using fallback method")
-                        return True
-                except:
-                    continue
-
-        except Exception as e:
-            logger.error(f"Fallback method error: {e}")
+                    if element is None:
+                        raise PlaywrightError("Reviews tab element is gone")
+                    await element.click()
+                except PlaywrightError as e:
+                    logger.debug(f"Reviews tab handle click failed ({e}), retrying by selector")
+                    await self.page.locator(match['selector']).nth(match['index']).click()
+                logger.info(f"✓ Clicked Reviews tab using '{match['selector']}' (text: '{match['text']}')")
+                return True
+        finally:
+            await handle.dispose()
 
         logger.warning("✗ Could not find Reviews tab button even with fallback")
         return False
@@ -308,22 +484,21 @@ class GoogleMapsScraper:
             sort_button = await self.page.query_selector('button[data-value="Sort"]')
             if sort_button:
                 await sort_button.click()
-                await self._random_delay(0.5, 1)
 
-                # Click "Newest" option
-                newest_button = await self.page.query_selector('div[data-index="1"]')
+                # Click "Newest" option once the menu has opened
+                newest_button = await self.page.wait_for_selector('div[data-index="1"]', timeout=5000)
                 if newest_button:
                     await newest_button.click()
                     logger.info("Sorted by newest")
         except Exception as e:
             logger.warning(f"Could not sort by newest: {e}")
 
-    async def _scrape_all_reviews(self) -> List[Dict]:
+    async def _scrape_all_reviews(self) -> List[ReviewRecord]:
         """
         Infinite scroll to load and scrape all reviews
 
         Returns:
-            List of review dictionaries
+            List of ReviewRecord
         """
         reviews = []
 
@@ -338,7 +513,7 @@ class GoogleMapsScraper:
         ]
 
         reviews_container = None
-        logger.info("Searching for reviews container...")
+        logger.debug("Searching for reviews container...")
         for selector in reviews_container_selectors:
             try:
                 reviews_container = await self.page.wait_for_selector(selector, timeout=10000)
@@ -350,12 +525,10 @@ class GoogleMapsScraper:
                 continue
 
         if not reviews_container:
-            logger.error("✗ Could not find reviews container. Taking debug screenshot.")
-            await self.page.screenshot(path='debug_no_container.png')
+            logger.error("✗ Could not find reviews container")
+            await self._debug_screenshot('debug_no_container.png')
             return reviews
 
-        last_count = 0
-        no_new_reviews_count = 0
         max_scrolls = 100  # Safety limit
 
         # Try multiple selectors for individual review elements
@@ -369,153 +542,56 @@ class GoogleMapsScraper:
 
         working_selector = None
         for selector in review_element_selectors:
-            test_elements = await reviews_container.query_selector_all(selector)
-            if len(test_elements) > 0:
+            found = await reviews_container.eval_on_selector_all(selector, 'els => els.length')
+            if found > 0:
                 working_selector = selector
-                logger.info(f"✓ Using review element selector: '{selector}' ({len(test_elements)} found)")
+                logger.info(f"✓ Using review element selector: '{selector}' ({found} found)")
                 break
 
         if not working_selector:
             logger.error("✗ Could not find review element selector")
-            await self.page.screenshot(path='debug_no_reviews.png')
+            await self._debug_screenshot('debug_no_reviews.png')
             return reviews
 
-        for scroll_iteration in range(max_scrolls):
-            # Get all review elements with the working selector
-            review_elements = await reviews_container.query_selector_all(working_selector)
-
-            logger.info(f"Scroll {scroll_iteration + 1}: Found {len(review_elements)} review elements")
-
-            # Extract new reviews
-            for elem in review_elements[last_count:]:
-                review_data = await self._extract_review_data(elem)
-                if review_data:
-                    reviews.append(review_data)
-
-                # Check if we've reached the maximum limit
-                if len(reviews) >= MAX_REVIEWS_TO_SCRAPE:
-                    logger.info(f"✓ Reached maximum review limit ({MAX_REVIEWS_TO_SCRAPE}), stopping")
-                    return reviews
-
-            # Check if new reviews loaded
-            current_count = len(review_elements)
-            if current_count == last_count:
-                no_new_reviews_count += 1
-                if no_new_reviews_count >= 3:
-                    logger.info("No new reviews after 3 scrolls, stopping")
-                    break
-            else:
-                no_new_reviews_count = 0
-
-            last_count = current_count
+        # Scroll, expand and read every review inside the page in one call
+        batch = await reviews_container.evaluate(_SCROLL_AND_COLLECT_JS, {
+            'selector': working_selector,
+            'maxReviews': MAX_REVIEWS_TO_SCRAPE,
+            'maxScrolls': max_scrolls,
+            'timeout': 4000,
+        })
+        logger.info(f"Loaded {batch['count']} review elements")
 
-            # Scroll to bottom of container
-            await reviews_container.evaluate('el => el.scrollTop = el.scrollHeight')
-            await self._random_delay(2, 4)
+        reviews = [self._build_review(row) for row in batch['rows']]
+        if len(reviews) >= MAX_REVIEWS_TO_SCRAPE:
+            logger.info(f"✓ Reached maximum review limit ({MAX_REVIEWS_TO_SCRAPE}), stopping")
 
         logger.info(f"Total reviews scraped: {len(reviews)}")
         return reviews
 
-    async def _extract_review_data(self, element) -> Optional[Dict]:
-        """
-        Extract individual review data
-
-        Returns:
-            {
-                'text': str,
-                'rating': int (1-5),
-                'timestamp': datetime,
-                'reviewer_name': str,
-                'reviewer_total_reviews': int,
-                'language': str ('he' or 'en')
-            }
-        """
-        try:
-            review_data = {}
-
-            # Extract reviewer name
-            try:
-                name_elem = await element.query_selector('div.d4r55')
-                if name_elem:
-                    review_data['reviewer_name'] = await name_elem.text_content()
-            except:
-                review_data['reviewer_name'] = 'Unknown'
-
-            # Extract rating (count filled stars)
-            try:
-                rating_elem = await element.query_selector('span.kvMYJc')
-                if rating_elem:
-                    rating_aria = await rating_elem.get_attribute('aria-label')
-                    if rating_aria:
-                        rating_match = re.search(r'(\\d+) star', rating_aria)
-                        if rating_match:
-                            review_data['rating'] = int(rating_match.group(1))
-            except:
-                review_data['rating'] = 5  # Default if can't extract
-
-            # Extract review text (click "More" button if truncated)
-            try:
-                more_button = await element.query_selector('button.w8nwRe')
-                if more_button:
-                    await more_button.click()
-                    await self._random_delay(0.3, 0.7)
-
-                text_elem = await element.query_selector('span.wiI7pd')
-                if text_elem:
-                    review_data['text'] = await text_elem.text_content()
-                else:
-                    review_data['text'] = ''
-            except:
-                review_data['text'] = ''
-
-            # Extract timestamp (relative time like "2 weeks ago")
-            try:
-                time_elem = await element.query_selector('span.rsqaWe')
-                if time_elem:
-                    timestamp_text = await time_elem.text_content()
-                    review_data['timestamp'] = self._parse_relative_time(timestamp_text)
-            except:
-                review_data['timestamp'] = datetime.now()
-
-            # Extract reviewer total reviews (from profile)
-            try:
-                # Click reviewer name to open profile
-                reviewer_button = await element.query_selector('button.WEBjve')
-                if reviewer_button:
-                    await reviewer_button.click()
-                    await self._random_delay(0.5, 1)
-
-                    # Extract total reviews from profile popup
-                    profile_reviews_elem = await self.page.query_selector('div.RfnDt')
-                    if profile_reviews_elem:
-                        profile_text = await profile_reviews_elem.text_content()
-                        reviews_match = re.search(r'([\\d,]+)\\s+review', profile_text, re.IGNORECASE)
-                        if reviews_match:
-                            review_data['reviewer_total_reviews'] = int(reviews_match.group(1).replace(',', ''))
-                        else:
-                            review_data['reviewer_total_reviews'] = 1
-                    else:
-                        review_data['reviewer_total_reviews'] = 1
-
-                    # Close profile popup
-                    close_button = await self.page.query_selector('button[aria-label="Close"]')
-                    if close_button:
-                        await close_button.click()
-                        await self._random_delay(0.3, 0.5)
-                else:
-                    review_data['reviewer_total_reviews'] = 1
-            except Exception as e:
-                logger.warning(f"Could not extract reviewer total reviews: {e}")
-                review_data['reviewer_total_reviews'] = 1
-
-            # Detect language
-            review_data['language'] = self._detect_language(review_data['text'])
-
-            return review_data
-
-        except Exception as e:
-            logger.error(f"Error extracting review: {e}")
-            return None
+    def _build_review(self, row: Dict) -> ReviewRecord:
+        """Turn one row of _SCROLL_AND_COLLECT_JS output into a ReviewRecord"""
+        rating = 5  # Default if can't extract
+        if row['rating_aria']:
+            rating_match = _RATING_RE.search(row['rating_aria'])
+            if rating_match:
+                rating = int(rating_match.group(1))
+
+        reviewer_total_reviews = 1
+        if row['reviewer_reviews']:
+            reviews_match = _REVIEWER_COUNT_RE.search(row['reviewer_reviews'])
+            if reviews_match:
+                reviewer_total_reviews = int(reviews_match.group(1).replace(',', ''))
+
+        text = row['text'] or ''
+        return ReviewRecord(
+            text=text,
+            rating=rating,
+            timestamp=self._parse_relative_time(row['time_text']) if row['time_text'] else datetime.now(),
+            reviewer_name=row['name'] or 'Unknown',
+            reviewer_total_reviews=reviewer_total_reviews,
+            language=self._detect_language(text)
+        )
 
     def _parse_relative_time(self, text: str) -> datetime:
         """
@@ -523,38 +599,47 @@ class GoogleMapsScraper:
 
         Examples: "2 weeks ago", "1 month ago", "3 days ago"
         """
-        text = text.lower()
         now = datetime.now()
+        delta = self._relative_delta(text)
+        return now if delta is None else now - delta
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _relative_delta(text: str) -> Optional[timedelta]:
+        """
+        How long ago a relative time string is, or None if it can't be parsed
 
+        Cached: reviews share a handful of strings like "2 weeks ago". The
+        current time is applied by the caller, so cached values never go stale.
+        """
         # Extract number and unit
-        match = re.search(r'(\\d+)\\s+(second|minute|hour|day|week|month|year)', text)
+        match = _REL_TIME_RE.search(text.lower())
 
         if not match:
-            return now
+            return None
 
         amount = int(match.group(1))
         unit = match.group(2)
 
         if 'second' in unit:
-            delta = timedelta(seconds=amount)
+            return timedelta(seconds=amount)
         elif 'minute' in unit:
-            delta = timedelta(minutes=amount)
+            return timedelta(minutes=amount)
         elif 'hour' in unit:
-            delta = timedelta(hours=amount)
+            return timedelta(hours=amount)
         elif 'day' in unit:
-            delta = timedelta(days=amount)
+            return timedelta(days=amount)
         elif 'week' in unit:
-            delta = timedelta(weeks=amount)
+            return timedelta(weeks=amount)
         elif 'month' in unit:
-            delta = timedelta(days=amount * 30)
+            return timedelta(days=amount * 30)
         elif 'year' in unit:
-            delta = timedelta(days=amount * 365)
-        else:
-            return now
-
-        return now - delta
+            return timedelta(days=amount * 365)
+        return None
 
-    def _detect_language(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _detect_language(text: str) -> str:
         """
         Detect if text is Hebrew or English
 
@@ -563,8 +648,8 @@ class GoogleMapsScraper:
         if not text:
             return 'en'
 
-        hebrew_chars = sum(1 for c in text if '\\u0590' <= c <= '\\u05FF')
         total_chars = len(text)
+        hebrew_chars = total_chars - len(text.translate(_HEBREW_TABLE))
 
         # If more than 30% Hebrew characters, consider it Hebrew
         if total_chars > 0 and (hebrew_chars / total_chars) > 0.3:
@@ -572,6 +657,12 @@ class GoogleMapsScraper:
         else:
             return 'en'
 
+    async def _debug_screenshot(self, path: str):
+        """Save a screenshot of the page, only when debug logging is on"""
+        if logger.isEnabledFor(logging.DEBUG):
+            await self.page.screenshot(path=path)
+            logger.debug(f"Screenshot saved: {path}")
+
     async def _random_delay(self, min_sec: float, max_sec: float):
         """Random delay to avoid detection"""
         delay = random.uniform(min_sec, max_sec)
@@ -598,11 +689,11 @@ async def main():
         print(f"\\n===== REVIEWS ({len(result['reviews'])}) =====")
         for i, review in enumerate(result['reviews'][:5], 1):
             print(f"\\nReview {i}:")
-            print(f"  Reviewer: {review['reviewer_name']} ({review['reviewer_total_reviews']} reviews)")
-            print(f"  Rating: {review['rating']}⭐")
-            print(f"  Date: {review['timestamp']}")
-            print(f"  Language: {review['language']}")
-            print(f"  Text: {review['text'][:100]}...")
+            print(f"  Reviewer: {review.reviewer_name} ({review.reviewer_total_reviews} reviews)")
+            print(f"  Rating: {review.rating}⭐")
+            print(f"  Date: {review.timestamp}")
+            print(f"  Language: {review.language}")
+            print(f"  Text: {review.text[:100]}...")
 
     finally:
         await scraper.close()
@@ -1,8 +1,41 @@
 """Google Maps URL parser and validator"""
+import logging
 import re
+from collections import OrderedDict
 from urllib.parse import urlparse, parse_qs, unquote
 from typing import Dict, Optional
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from config import USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import - these run on every /analyze request
+_GM_RE = re.compile(
+    r'google\.com/maps|maps\.google\.com|goo\.gl|maps\.app\.goo\.gl|google\.com/search.*maps',
+    re.IGNORECASE
+)
+_PLACE_RE = re.compile(r'/place/([^/@]+)')
+_COORDS_RE = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)')
+
+# Shared async client for fetches that don't need a browser (short-URL redirects).
+# Keep-alive + HTTP/2 means repeat requests to goo.gl skip the TLS handshake.
+# Created on first use (see _get_client) so it binds to the serving event loop.
+_client: Optional[httpx.AsyncClient] = None
+
+# Same idea for the synchronous parser (CLI scripts, normalize_url)
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = USER_AGENT
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# HEAD responses that mean "ask again with GET"
+_HEAD_REJECTED = {403, 405}
+
+# Resolved short URLs - the same links get re-submitted often (LRU)
+REDIRECT_CACHE_SIZE = 4096
+_redirect_cache: "OrderedDict[str, str]" = OrderedDict()
 
 
 def parse_google_maps_url(url: str) -> Dict:
@@ -24,7 +57,60 @@ def parse_google_maps_url(url: str) -> Dict:
             'coordinates': {'lat': float, 'lng': float} or None
         }
     """
-    result = {
+    result = _new_result(url)
+    url = _clean_url(url)
+    result['final_url'] = url
+
+    # Check if it's a Google Maps URL
+    if not url or not is_google_maps_url(url):
+        return result
+
+    # Handle short URLs (goo.gl) - follow redirect
+    if _is_short_url(url):
+        short_url = url
+        url = _redirect_cache_get(short_url)
+        if url is None:
+            try:
+                url = follow_redirect(short_url)
+            except Exception as e:
+                logger.error(f"Error following redirect: {e}")
+                return result
+        return _remember_redirect(short_url, _parse_final_url(result, url))
+
+    return _parse_final_url(result, url)
+
+
+async def parse_google_maps_url_async(url: str) -> Dict:
+    """
+    Async variant of parse_google_maps_url for use inside the web app
+
+    Short URLs are resolved with the shared httpx client instead of a blocking
+    requests call, so the event loop keeps serving other requests meanwhile.
+    """
+    result = _new_result(url)
+    url = _clean_url(url)
+    result['final_url'] = url
+
+    if not url or not is_google_maps_url(url):
+        return result
+
+    if _is_short_url(url):
+        short_url = url
+        url = _redirect_cache_get(short_url)
+        if url is None:
+            try:
+                url = await follow_redirect_async(short_url)
+            except Exception as e:
+                logger.error(f"Error following redirect: {e}")
+                return result
+        return _remember_redirect(short_url, _parse_final_url(result, url))
+
+    return _parse_final_url(result, url)
+
+
+def _new_result(url: str) -> Dict:
+    """Empty (invalid) parse result for url"""
+    return {
         'is_valid': False,
         'original_url': url,
         'final_url': url,
@@ -33,10 +119,12 @@ def parse_google_maps_url(url: str) -> Dict:
         'coordinates': None
     }
 
+
+def _clean_url(url: str) -> str:
+    """Strip whitespace and fix duplicated protocols"""
     if not url or not isinstance(url, str):
-        return result
+        return ''
 
-    # Clean up URL - remove duplicate protocols
     url = url.strip()
     # Fix double protocol issues (http://https:// or https://http://)
     if url.startswith('http://https://'):
@@ -47,28 +135,43 @@ def parse_google_maps_url(url: str) -> Dict:
         url = url.replace('http://http://', 'http://')
     elif url.startswith('https://https://'):
         url = url.replace('https://https://', 'https://')
+    return url
 
-    # Update final_url with cleaned URL
-    result['final_url'] = url
 
-    # Check if it's a Google Maps URL
-    if not is_google_maps_url(url):
-        return result
+def _is_short_url(url: str) -> bool:
+    """Check if url is a goo.gl short link that must be resolved first"""
+    return 'goo.gl' in url or 'maps.app.goo.gl' in url
 
-    # Handle short URLs (goo.gl) - follow redirect
-    if 'goo.gl' in url or 'maps.app.goo.gl' in url:
-        try:
-            final_url = follow_redirect(url)
-            result['final_url'] = final_url
-            url = final_url
-        except Exception as e:
-            print(f"Error following redirect: {e}")
-            return result
 
+def _redirect_cache_get(short_url: str) -> Optional[str]:
+    """Previously resolved target of short_url, or None"""
+    final_url = _redirect_cache.get(short_url)
+    if final_url is not None:
+        _redirect_cache.move_to_end(short_url)
+    return final_url
+
+
+def _remember_redirect(short_url: str, result: Dict) -> Dict:
+    """
+    Cache where short_url led, if it led to a usable Maps URL
+
+    Consent pages and other non-Maps targets are not cached, so a bad
+    resolution is retried next time instead of sticking.
+    """
+    if result['is_valid']:
+        _redirect_cache[short_url] = result['final_url']
+        if len(_redirect_cache) > REDIRECT_CACHE_SIZE:
+            _redirect_cache.popitem(last=False)
+    return result
+
+
+def _parse_final_url(result: Dict, url: str) -> Dict:
+    """Fill result from a resolved Google Maps URL"""
+    result['final_url'] = url
     parsed = urlparse(url)
 
     # Extract business name from /place/ path
-    place_match = re.search(r'/place/([^/@]+)', parsed.path)
+    place_match = _PLACE_RE.search(parsed.path)
     if place_match:
         business_name = place_match.group(1)
         # Decode URL encoding and replace + with spaces
@@ -76,7 +179,7 @@ def parse_google_maps_url(url: str) -> Dict:
         result['business_name'] = business_name
 
     # Extract coordinates from @lat,lng format
-    coords_match = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', parsed.path)
+    coords_match = _COORDS_RE.search(parsed.path)
     if coords_match:
         lat, lng = coords_match.groups()
         result['coordinates'] = {'lat': float(lat), 'lng': float(lng)}
@@ -97,15 +200,7 @@ def parse_google_maps_url(url: str) -> Dict:
 
 def is_google_maps_url(url: str) -> bool:
     """Check if URL is a Google Maps URL"""
-    google_maps_patterns = [
-        r'google\.com/maps',
-        r'maps\.google\.com',
-        r'goo\.gl',
-        r'maps\.app\.goo\.gl',
-        r'google\.com/search.*maps'
-    ]
-
-    return any(re.search(pattern, url, re.IGNORECASE) for pattern in google_maps_patterns)
+    return _GM_RE.search(url) is not None
 
 
 def follow_redirect(url: str, max_redirects: int = 5) -> str:
@@ -119,16 +214,73 @@ def follow_redirect(url: str, max_redirects: int = 5) -> str:
     Returns:
         Final URL after all redirects
     """
+    head_error = None
     try:
-        response = requests.head(url, allow_redirects=True, timeout=10)
-        return response.url
+        response = SESSION.head(url, allow_redirects=True, timeout=10)
+        if response.status_code not in _HEAD_REJECTED:
+            return response.url
     except Exception as e:
-        # If HEAD fails, try GET
-        try:
-            response = requests.get(url, allow_redirects=True, timeout=10)
+        head_error = e
+
+    # If HEAD fails, try GET - but only read the headers, never the page body
+    try:
+        with SESSION.get(url, allow_redirects=True, timeout=10, stream=True) as response:
             return response.url
-        except Exception:
-            raise e
+    except Exception:
+        if head_error is not None:
+            raise head_error
+        raise
+
+
+async def follow_redirect_async(url: str) -> str:
+    """
+    Follow URL redirects without blocking the event loop
+
+    Args:
+        url: Short URL to follow
+
+    Returns:
+        Final URL after all redirects
+    """
+    client = _get_client()
+    head_error = None
+    try:
+        response = await client.head(url)
+        if response.status_code not in _HEAD_REJECTED:
+            return str(response.url)
+    except Exception as e:
+        head_error = e
+
+    # If HEAD fails, try GET - but only read the headers, never the page body
+    try:
+        async with client.stream('GET', url) as response:
+            return str(response.url)
+    except Exception:
+        if head_error is not None:
+            raise head_error
+        raise
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it if needed"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            headers={'User-Agent': USER_AGENT},
+            timeout=10.0,
+            follow_redirects=True,
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared httpx client's connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 def normalize_url(url: str) -> str:
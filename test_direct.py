@@ -5,13 +5,17 @@ sys.path.insert(0, '.')
 
 from scraper.playwright_scraper import GoogleMapsScraper
 
-async def test_scrape(url):
-    print(f"Testing URL: {url}\n")
+async def test_scrape(urls):
+    # One browser and context for every URL - only the pages are per-URL
+    async with GoogleMapsScraper(headless=True) as scraper:
+        results = await scraper.scrape_businesses(urls)
 
-    scraper = GoogleMapsScraper(headless=True)
-    try:
-        await scraper.initialize()
-        result = await scraper.scrape_business(url)
+    for url, result in zip(urls, results):
+        print(f"Testing URL: {url}\n")
+
+        if isinstance(result, BaseException):
+            print(f"\n❌ SCRAPE FAILED: {result}")
+            continue
 
         print(f"\n=== RESULTS ===")
         print(f"Business Name: {result['business']['name']}")
@@ -20,16 +24,15 @@ async def test_scrape(url):
 
         if len(result['reviews']) == 0:
             print("\n❌ NO REVIEWS SCRAPED")
-            print("Check debug_*.png screenshots")
+            print("Re-run with debug logging to get debug_*.png screenshots")
         else:
             print("\n✓ SUCCESS")
-            print(f"First review: {result['reviews'][0]['text'][:100]}...")
+            print(f"First review: {result['reviews'][0].text[:100]}...")
 
-        return result
-    finally:
-        await scraper.close()
+    return results
 
 if __name__ == '__main__':
     url = "https://www.google.com/maps/place/%D7%99%D7%A8%D7%99%D7%93+%D7%94%D7%97%D7%A9%D7%9E%D7%9C%E2%80%AD/@31.991078,34.876977,17z/data=!4m8!3m7!1s0x1502caba776b7693:0x70f05b0377467d37!8m2!3d31.991078!4d34.876977!9m1!1b1!16s%2Fg%2F11h7s42pz3?entry=ttu&g_ep=EgoyMDI2MDIxMS4wIKXMDSoASAFQAw%3D%3D"
+    urls = sys.argv[1:] or [url]
 
-    result = asyncio.run(test_scrape(url))
+    results = asyncio.run(test_scrape(urls))
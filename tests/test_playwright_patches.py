@@ -0,0 +1,48 @@
+"""Tests for the Playwright stack-capture patch"""
+import importlib.util
+import pkgutil
+
+import pytest
+
+playwright_impl = pytest.importorskip('playwright._impl')
+
+from scraper import playwright_patches
+from scraper.playwright_patches import STACK_CAPTURE_MODULES, disable_stack_capture
+
+# Needs the real caller frame; see STACK_CAPTURE_MODULES
+UNPATCHED = {'_path_utils'}
+
+
+def _modules_calling_inspect_stack():
+    names = set()
+    for info in pkgutil.iter_modules(playwright_impl.__path__):
+        spec = importlib.util.find_spec(f'playwright._impl.{info.name}')
+        if spec is None or spec.origin is None or not spec.origin.endswith('.py'):
+            continue
+        with open(spec.origin, encoding='utf-8') as f:
+            if 'inspect.stack(' in f.read():
+                names.add(info.name)
+    return names
+
+
+def test_every_stack_capture_call_site_is_patched():
+    assert _modules_calling_inspect_stack() - UNPATCHED == set(STACK_CAPTURE_MODULES)
+
+
+def test_patch_replaces_inspect_stack(monkeypatch):
+    monkeypatch.delenv('PW_INSPECT_STACK', raising=False)
+    modules = [importlib.import_module(f'playwright._impl.{name}')
+               for name in STACK_CAPTURE_MODULES]
+    for module in modules:
+        monkeypatch.setattr(module, 'inspect', module.inspect)
+
+    assert disable_stack_capture() is True
+    for module in modules:
+        assert module.inspect.stack() == []
+
+
+def test_patch_fails_loudly_when_call_site_moves(monkeypatch):
+    monkeypatch.delenv('PW_INSPECT_STACK', raising=False)
+    monkeypatch.setattr(playwright_patches, 'STACK_CAPTURE_MODULES', ('_no_such_module',))
+    with pytest.raises(RuntimeError, match='_no_such_module'):
+        disable_stack_capture()
@@ -0,0 +1,90 @@
+"""FraudScorer output for fixed rule results"""
+import pytest
+
+from fraud_detection.scoring import FraudScorer
+
+
+def _rule_results(text_score, timing_score):
+    return {
+        'TextSimilarityRule': {'score': text_score, 'flagged_items': [], 'reasoning': 'text reason'},
+        'TimingAnalysisRule': {'score': timing_score, 'flagged_items': [], 'reasoning': 'timing reason'},
+    }
+
+
+def test_calculate_score_is_pinned():
+    result = FraudScorer().calculate_score(_rule_results(42.345, 80.0))
+
+    assert result == {
+        'overall_score': 57.4,
+        'risk_level': 'MEDIUM',
+        'breakdown': {
+            'TextSimilarityRule': {
+                'score': 42.3, 'weight': 0.6, 'contribution': 25.4, 'reasoning': 'text reason'
+            },
+            'TimingAnalysisRule': {
+                'score': 80.0, 'weight': 0.4, 'contribution': 32.0, 'reasoning': 'timing reason'
+            },
+        },
+        # Ordered by contribution
+        'reasoning': ['TimingAnalysis: timing reason', 'TextSimilarity: text reason'],
+    }
+
+
+def test_calculate_score_without_significant_rules():
+    result = FraudScorer().calculate_score(_rule_results(10.0, 0.0))
+
+    assert result['overall_score'] == 6.0
+    assert result['risk_level'] == 'MINIMAL'
+    assert result['reasoning'] == ['No significant fraud indicators detected']
+
+
+def test_calculate_score_caps_at_100():
+    result = FraudScorer().calculate_score(_rule_results(150.0, 150.0))
+
+    assert result['overall_score'] == 100.0
+    assert result['risk_level'] == 'HIGH'
+    assert result['breakdown']['TextSimilarityRule']['contribution'] == 90.0
+
+
+def test_calculate_score_returns_fresh_containers():
+    scorer = FraudScorer()
+    first = scorer.calculate_score(_rule_results(30.0, 30.0))
+    first['breakdown']['TextSimilarityRule']['score'] = -1
+    first['reasoning'].append('mutated')
+
+    second = scorer.calculate_score(_rule_results(30.0, 30.0))
+    assert second['breakdown']['TextSimilarityRule']['score'] == 30.0
+    assert 'mutated' not in second['reasoning']
+
+
+@pytest.mark.parametrize('score, level', [
+    (0, 'MINIMAL'), (24.9, 'MINIMAL'), (25, 'LOW'), (50, 'MEDIUM'), (74.9, 'MEDIUM'), (75, 'HIGH'), (100, 'HIGH'),
+])
+def test_risk_levels(score, level):
+    assert FraudScorer._get_risk_level(score) == level
+
+
+def test_report_summary_is_pinned():
+    summary = FraudScorer().report_summary(33.3, 5.0, 22.0)
+
+    assert summary == {
+        'overall_score': 22.0,
+        'risk_level': 'MINIMAL',
+        'breakdown': {
+            'TextSimilarityRule': {
+                'score': 33.3, 'weight': 0.6, 'contribution': 20.0, 'reasoning': 'Text similarity analysis'
+            },
+            'TimingAnalysisRule': {
+                'score': 5.0, 'weight': 0.4, 'contribution': 2.0, 'reasoning': 'Timing cluster analysis'
+            },
+        },
+        # Only scores above 10 are listed
+        'reasoning': ['Text Similarity: 33.3% of reviews are similar'],
+    }
+
+
+def test_report_summary_omits_zero_scores():
+    summary = FraudScorer().report_summary(0, 0, 0)
+
+    assert summary['breakdown'] == {}
+    assert summary['reasoning'] == []
@@ -0,0 +1,122 @@
+"""TextSimilarityRule candidate search checked against a brute-force reference"""
+import random
+
+import pytest
+from rapidfuzz import fuzz
+
+from fraud_detection.rules import text_similarity
+from fraud_detection.rules.text_similarity import TextSimilarityRule
+
+WORDS = [
+    'great', 'service', 'food', 'staff', 'friendly', 'slow', 'price', 'clean',
+    'amazing', 'recommend', 'never', 'again', 'place', 'coffee', 'pizza',
+    'מעולה', 'שירות', 'אוכל', 'מומלץ', 'מקום', 'יקר',
+]
+
+
+def _corpus(seed: int, size: int = 300):
+    """Random reviews, with near-copies and exact copies mixed in"""
+    rng = random.Random(seed)
+    texts = []
+    while len(texts) < size:
+        if texts and rng.random() < 0.4:
+            base = list(rng.choice(texts))
+            # A few character edits keep the copy around the threshold
+            for _ in range(rng.randint(0, 6)):
+                pos = rng.randrange(len(base))
+                base[pos] = rng.choice('abcdefgh ')
+            texts.append(''.join(base))
+        else:
+            texts.append(' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 20))))
+    return texts
+
+
+def _brute_force_pairs(texts, threshold):
+    """Every (i, j, similarity) with i < j, scored pair by pair"""
+    pairs = set()
+    for i in range(len(texts)):
+        for j in range(i + 1, len(texts)):
+            similarity = int(fuzz.ratio(texts[i], texts[j]) + 0.5)
+            if similarity >= threshold:
+                pairs.add((i, j, similarity))
+    return pairs
+
+
+def _as_set(scored_pairs):
+    return {(int(i), int(j), int(s)) for i, j, s in scored_pairs}
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('threshold', [85, 70, 84.5])
+def test_matrix_pairs_match_brute_force(seed, threshold, monkeypatch):
+    # Small bands so the corpus spans many cdist calls
+    monkeypatch.setattr(text_similarity, 'MATRIX_BAND_ROWS', 16)
+    rule = TextSimilarityRule(threshold=threshold)
+    texts = list(dict.fromkeys(_corpus(seed)))
+
+    expected = _brute_force_pairs(texts, rule.threshold)
+    assert expected  # the corpus must actually contain matches
+    assert _as_set(rule._matrix_pairs(texts)) == expected
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_lsh_pairs_are_exact_scores_of_true_matches(seed):
+    if text_similarity.MinHashLSH is None:
+        pytest.skip('datasketch not installed')
+    rule = TextSimilarityRule()
+    texts = list(dict.fromkeys(_corpus(seed)))
+
+    expected = _brute_force_pairs(texts, rule.threshold)
+    found = _as_set(rule._lsh_pairs(texts))
+
+    # LSH may only drop pairs, never invent or mis-score them
+    assert found <= expected
+    # Near-copies share most shingles, so nearly all of them survive blocking
+    assert len(found) >= 0.9 * len(expected)
+
+
+def _reviews(texts):
+    return [
+        {'id': idx + 1, 'reviewer_id': idx + 1, 'review_text': text, 'reviewer_name': f'r{idx}'}
+        for idx, text in enumerate(texts)
+    ]
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_analyze_counts_every_brute_force_pair(seed):
+    reviews = _reviews(_corpus(seed))
+    rule = TextSimilarityRule()
+    result = rule.analyze(reviews, {})
+
+    eligible = [r for r in reviews if len(r['review_text']) >= 20]
+    texts = [r['review_text'] for r in eligible]
+    expected = _brute_force_pairs(texts, rule.threshold)
+
+    assert result['reasoning'] == (
+        f"Found {len(expected)} pairs of highly similar reviews (>{rule.threshold}% match)"
+    )
+    flagged_ids = {eligible[i]['id'] for i, j, _ in expected} | {eligible[j]['id'] for i, j, _ in expected}
+    assert result['score'] == pytest.approx(len(flagged_ids) / len(reviews) * 100)
+    # Display list: the first 10 pairs in review order
+    assert [(p['review1_id'], p['review2_id'], p['similarity']) for p in result['flagged_items']] == [
+        (eligible[i]['id'], eligible[j]['id'], s) for i, j, s in sorted(expected)[:10]
+    ]
+
+
+def test_analyze_with_forced_lsh_only_reports_true_pairs():
+    if text_similarity.MinHashLSH is None:
+        pytest.skip('datasketch not installed')
+    reviews = _reviews(_corpus(3))
+    # Force the LSH branch, unreachable at production review counts
+    rule = TextSimilarityRule(lsh_min_reviews=2)
+    result = rule.analyze(reviews, {})
+
+    eligible = [r for r in reviews if len(r['review_text']) >= 20]
+    expected = {
+        (eligible[i]['id'], eligible[j]['id'], s)
+        for i, j, s in _brute_force_pairs([r['review_text'] for r in eligible], rule.threshold)
+    }
+
+    assert result['flagged_items']
+    for p in result['flagged_items']:
+        assert (p['review1_id'], p['review2_id'], p['similarity']) in expected
@@ -0,0 +1,130 @@
+"""TimingAnalysisRule cluster output, pinned and checked against a per-minute dict reference"""
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fraud_detection.rules.timing_analysis import TimingAnalysisRule
+
+BASE = datetime(2024, 3, 10, 14, 0, 0)
+
+
+def _review(review_id, review_date, name=None):
+    return {'id': review_id, 'review_date': review_date, 'reviewer_name': name or f'r{review_id}'}
+
+
+def _reference(reviews, min_cluster_size=2):
+    """Bucket by minute in a dict and sort clusters by size (stable)"""
+    buckets = defaultdict(list)
+    for review in reviews:
+        timestamp = review.get('review_date')
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp)
+            except ValueError:
+                continue
+        elif not isinstance(timestamp, datetime):
+            continue
+        buckets[timestamp.replace(second=0, microsecond=0)].append(review)
+
+    clusters = [
+        {
+            'timestamp': minute,
+            'count': len(bucket),
+            'review_ids': [r.get('id') for r in bucket],
+            'reviewers': [r.get('reviewer_name', 'Unknown') for r in bucket],
+        }
+        for minute, bucket in buckets.items()
+        if len(bucket) >= min_cluster_size
+    ]
+    in_clusters = sum(c['count'] for c in clusters)
+    return sorted(clusters, key=lambda c: c['count'], reverse=True), in_clusters
+
+
+def test_fixed_input_is_pinned():
+    reviews = [
+        _review(1, BASE + timedelta(seconds=5)),
+        _review(2, BASE + timedelta(minutes=3)),
+        _review(3, BASE + timedelta(seconds=59)),
+        _review(4, (BASE + timedelta(minutes=3, seconds=30)).isoformat()),
+        _review(5, BASE + timedelta(minutes=3, seconds=1)),
+        _review(6, BASE + timedelta(minutes=7)),
+        _review(7, 'not a date'),
+        _review(8, None),
+        _review(9, BASE + timedelta(seconds=20)),
+        _review(10, BASE + timedelta(minutes=9)),
+    ]
+    result = TimingAnalysisRule().analyze(reviews, {})
+
+    # Equal sizes keep first-appearance order
+    assert result['flagged_items'] == [
+        {
+            'timestamp': BASE,
+            'count': 3,
+            'review_ids': [1, 3, 9],
+            'reviewers': ['r1', 'r3', 'r9'],
+        },
+        {
+            'timestamp': BASE + timedelta(minutes=3),
+            'count': 3,
+            'review_ids': [2, 4, 5],
+            'reviewers': ['r2', 'r4', 'r5'],
+        },
+    ]
+    assert result['score'] == pytest.approx(60.0)
+    assert result['reasoning'] == (
+        "Found 2 timing clusters. Largest cluster: 3 reviews posted at 2024-03-10T14:00:00"
+    )
+
+
+def test_aware_timestamps_bucket_by_instant():
+    utc = BASE.replace(tzinfo=timezone.utc)
+    plus2 = timezone(timedelta(hours=2))
+    reviews = [
+        _review(1, utc + timedelta(seconds=10)),
+        _review(2, (utc + timedelta(seconds=40)).astimezone(plus2)),
+        _review(3, BASE + timedelta(seconds=30)),  # naive: never joins an aware bucket
+    ]
+    result = TimingAnalysisRule().analyze(reviews, {})
+
+    assert [c['review_ids'] for c in result['flagged_items']] == [[1, 2]]
+    assert result['flagged_items'][0]['timestamp'] == utc
+
+
+def test_no_clusters():
+    reviews = [_review(i, BASE + timedelta(minutes=i)) for i in range(5)]
+    result = TimingAnalysisRule().analyze(reviews, {})
+
+    assert result == {
+        'score': 0.0,
+        'flagged_items': [],
+        'reasoning': 'No suspicious timing patterns detected',
+    }
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('min_cluster_size', [2, 3])
+def test_matches_reference_on_random_input(seed, min_cluster_size):
+    rng = random.Random(seed)
+    reviews = []
+    for idx in range(400):
+        # Few distinct minutes, so there are many clusters (more than 10) and ties
+        review_date = BASE + timedelta(minutes=rng.randint(0, 60), seconds=rng.randint(0, 59))
+        roll = rng.random()
+        if roll < 0.1:
+            review_date = review_date.isoformat()
+        elif roll < 0.12:
+            review_date = 'garbage'
+        reviews.append(_review(idx, review_date))
+
+    result = TimingAnalysisRule(min_cluster_size=min_cluster_size).analyze(reviews, {})
+    expected, in_clusters = _reference(reviews, min_cluster_size)
+
+    assert len(expected) > 10
+    assert result['flagged_items'] == expected[:10]
+    assert result['score'] == pytest.approx(in_clusters / len(reviews) * 100)
+    assert result['reasoning'] == (
+        f"Found {len(expected)} timing clusters. Largest cluster: {expected[0]['count']} "
+        f"reviews posted at {expected[0]['timestamp'].isoformat()}"
+    )